@@ -2,6 +2,7 @@
 # Purpose: The main command-line entry point for the Financial Analysis System.
 
 import argparse
+import asyncio
 import logging
 import sys
 from pathlib import Path
@@ -10,19 +11,11 @@ from pathlib import Path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root / "src"))
 
-from financial_analysis.core.logging_config import setup_logging
+# NOTE: Application imports are deferred into main() so that `-h`, argument
+# errors and the text-only path do not pay for the pandas/openpyxl/redis
+# import chain (several hundred ms of cold start).
 from financial_analysis.core.config import settings
-from financial_analysis.system import FinancialAnalysisSystem
-from financial_analysis.services.data_service import DataService
-from financial_analysis.services.calculation_service import CalculationService
-from financial_analysis.services.analysis_service import AnalysisService
-from financial_analysis.data_providers.sec_edgar_provider import SecEdgarProvider
-from financial_analysis.data_providers.yfinance_provider import YFinanceProvider
-from financial_analysis.reporting.text_reporter import TextReporter
-from financial_analysis.reporting.excel_reporter import ExcelReporter
 
-# Initialize logging as the first action
-setup_logging()
 logger = logging.getLogger(__name__)
 
 def main():
@@ -33,8 +26,9 @@ def main():
     parser.add_argument(
         "-t", "--ticker",
         type=str,
+        nargs="+",
         required=True,
-        help="The stock ticker symbol of the company to analyze (e.g., AAPL)."
+        help="One or more stock ticker symbols to analyze (e.g., AAPL MSFT)."
     )
     parser.add_argument(
         "-y", "--years",
@@ -42,35 +36,55 @@ def main():
         default=settings.NUM_HISTORICAL_YEARS,
         help=f"The number of historical years to analyze (default: {settings.NUM_HISTORICAL_YEARS})."
     )
+    parser.add_argument(
+        "--no-excel",
+        action="store_true",
+        help="Skip the Excel report (avoids importing pandas/openpyxl entirely)."
+    )
     args = parser.parse_args()
 
+    # Initialize logging once we know we are actually running an analysis.
+    from financial_analysis.core.logging_config import setup_logging
+    setup_logging()
+
     try:
         # --- Dependency Injection Setup ---
+        # Imports happen here so only the components actually used are loaded.
+        from financial_analysis.system import FinancialAnalysisSystem
+        from financial_analysis.services.data_service import DataService
+        from financial_analysis.services.calculation_service import CalculationService
+        from financial_analysis.services.analysis_service import AnalysisService
+        from financial_analysis.data_providers.sec_edgar_provider import SecEdgarProvider
+        from financial_analysis.data_providers.yfinance_provider import YFinanceProvider
+        from financial_analysis.reporting.text_reporter import TextReporter
+
         # 1. Instantiate Providers
         sec_provider = SecEdgarProvider()
         yfinance_provider = YFinanceProvider()
-        
+
         # 2. Instantiate Services
         # The order of providers matters: the first is the primary source for statements.
         # Subsequent providers are used for enrichment and as fallbacks.
         data_service = DataService(providers=[sec_provider, yfinance_provider])
         calculation_service = CalculationService()
         analysis_service = AnalysisService()
-        
+
         # 3. Instantiate Reporters
-        text_reporter = TextReporter()
-        excel_reporter = ExcelReporter()
-        
+        reporters = [TextReporter()]
+        if not args.no_excel:
+            from financial_analysis.reporting.excel_reporter import ExcelReporter
+            reporters.append(ExcelReporter())
+
         # 4. Instantiate the main system orchestrator
         system = FinancialAnalysisSystem(
             data_service=data_service,
             calculation_service=calculation_service,
             analysis_service=analysis_service,
-            reporters=[text_reporter, excel_reporter]
+            reporters=reporters
         )
-        
-        # 5. Run the system
-        system.run(ticker=args.ticker, num_years=args.years, output_dir=settings.REPORTS_DIR)
+
+        # 5. Run the system, analyzing all requested tickers concurrently
+        asyncio.run(system.run_async(tickers=args.ticker, num_years=args.years, output_dir=settings.REPORTS_DIR))
 
     except Exception as e:
         logger.critical(f"A critical error occurred in the analysis pipeline: {e}", exc_info=True)
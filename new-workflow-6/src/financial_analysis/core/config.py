@@ -2,6 +2,7 @@
 # Purpose: Centralized application configuration. (Updated for Redis)
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from pydantic_settings import BaseSettings
 
@@ -18,12 +19,14 @@ class Settings(BaseSettings):
     REPORTS_DIR: Path = BASE_DIR / "reports"
     LOGS_DIR: Path = BASE_DIR / "logs"
     LOG_FILE: Path = LOGS_DIR / "financial_analysis.log"
+    CACHE_DIR: Path = BASE_DIR / ".cache"
+    CIK_MAP_CACHE_FILE: Path = CACHE_DIR / "cik_map.pkl"
 
     # SEC EDGAR API Configuration (loaded from .env)
     SEC_USER_AGENT: str = "Default Agent default@example.com"
     
     # Data Request Settings
-    REQUEST_DELAY_SECONDS: float = 0.2
+    SEC_MAX_RPS: float = 10.0  # SEC EDGAR fair-access ceiling of 10 requests/second
     NUM_HISTORICAL_YEARS: int = 5
 
     # Redis Cache Configuration (loaded from .env)
@@ -36,5 +39,16 @@ class Settings(BaseSettings):
         env_file = ".env"
         env_file_encoding = 'utf-8'
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Returns the process-wide Settings singleton.
+
+    BaseSettings re-reads the .env file on every instantiation, so the cache
+    guarantees that cost is paid exactly once per process regardless of how
+    many modules (or subprocesses importing this module) request settings.
+    """
+    return Settings()
+
 # Instantiate the settings object for easy import across the application
-settings = Settings()
+settings = get_settings()
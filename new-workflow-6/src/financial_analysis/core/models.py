@@ -2,6 +2,7 @@
 # Purpose: Defines the canonical, strictly-typed data structures for the entire application.
 # Using Pydantic models ensures data integrity and validation at runtime.
 
+from dataclasses import dataclass
 from pydantic import BaseModel, Field
 from typing import List, Optional, Dict, Any
 from datetime import datetime
@@ -9,39 +10,47 @@ from datetime import datetime
 # It's good practice to use aliases for long XBRL-like names to keep our code clean,
 # while still being able to parse data from sources that use those names.
 
-class IncomeStatement(BaseModel):
+# The three per-period statements are trivial float containers on the hottest
+# construction path, so they are slotted dataclasses rather than Pydantic
+# models: ~half the memory per instance and much cheaper to instantiate.
+# Pydantic still validates them when they appear as FinancialStatement fields.
+
+@dataclass(slots=True)
+class IncomeStatement:
     """Data model for a single period's Income Statement."""
-    revenue: Optional[float] = Field(None, description="Total Revenue or Sales")
-    cost_of_goods_sold: Optional[float] = Field(None, description="Cost of Goods Sold (COGS)")
-    gross_profit: Optional[float] = Field(None, description="Gross Profit (Revenue - COGS)")
-    operating_income: Optional[float] = Field(None, description="Operating Income or EBIT")
-    interest_expense: Optional[float] = Field(None, description="Interest Expense")
-    net_income: Optional[float] = Field(None, description="Net Income")
-    ebitda: Optional[float] = Field(None, description="Earnings Before Interest, Taxes, Depreciation, and Amortization")
-    eps_basic: Optional[float] = Field(None, description="Basic Earnings Per Share")
-    eps_diluted: Optional[float] = Field(None, description="Diluted Earnings Per Share")
+    revenue: Optional[float] = None  # Total Revenue or Sales
+    cost_of_goods_sold: Optional[float] = None  # Cost of Goods Sold (COGS)
+    gross_profit: Optional[float] = None  # Gross Profit (Revenue - COGS)
+    operating_income: Optional[float] = None  # Operating Income or EBIT
+    interest_expense: Optional[float] = None  # Interest Expense
+    net_income: Optional[float] = None  # Net Income
+    ebitda: Optional[float] = None  # Earnings Before Interest, Taxes, Depreciation, and Amortization
+    eps_basic: Optional[float] = None  # Basic Earnings Per Share
+    eps_diluted: Optional[float] = None  # Diluted Earnings Per Share
 
-class BalanceSheet(BaseModel):
+@dataclass(slots=True)
+class BalanceSheet:
     """Data model for a single period's Balance Sheet."""
-    total_assets: Optional[float] = Field(None, description="Total Assets")
-    current_assets: Optional[float] = Field(None, description="Total Current Assets")
-    cash_and_equivalents: Optional[float] = Field(None, description="Cash and Cash Equivalents")
-    inventory: Optional[float] = Field(None, description="Inventory")
-    accounts_receivable: Optional[float] = Field(None, description="Accounts Receivable")
-    
-    total_liabilities: Optional[float] = Field(None, description="Total Liabilities")
-    current_liabilities: Optional[float] = Field(None, description="Total Current Liabilities")
-    
-    total_debt: Optional[float] = Field(None, description="Total Debt (Short-term and Long-term)")
-    shareholders_equity: Optional[float] = Field(None, description="Total Shareholders' Equity")
-    shares_outstanding: Optional[float] = Field(None, description="Weighted Average Shares Outstanding")
+    total_assets: Optional[float] = None  # Total Assets
+    current_assets: Optional[float] = None  # Total Current Assets
+    cash_and_equivalents: Optional[float] = None  # Cash and Cash Equivalents
+    inventory: Optional[float] = None  # Inventory
+    accounts_receivable: Optional[float] = None  # Accounts Receivable
+
+    total_liabilities: Optional[float] = None  # Total Liabilities
+    current_liabilities: Optional[float] = None  # Total Current Liabilities
+
+    total_debt: Optional[float] = None  # Total Debt (Short-term and Long-term)
+    shareholders_equity: Optional[float] = None  # Total Shareholders' Equity
+    shares_outstanding: Optional[float] = None  # Weighted Average Shares Outstanding
 
-class CashFlowStatement(BaseModel):
+@dataclass(slots=True)
+class CashFlowStatement:
     """Data model for a single period's Cash Flow Statement."""
-    operating_cash_flow: Optional[float] = Field(None, description="Net Cash Flow from Operating Activities")
-    capital_expenditures: Optional[float] = Field(None, description="Capital Expenditures (CapEx)")
-    free_cash_flow: Optional[float] = Field(None, description="Free Cash Flow (OCF - CapEx)")
-    dividend_payments: Optional[float] = Field(None, description="Cash Paid for Dividends")
+    operating_cash_flow: Optional[float] = None  # Net Cash Flow from Operating Activities
+    capital_expenditures: Optional[float] = None  # Capital Expenditures (CapEx)
+    free_cash_flow: Optional[float] = None  # Free Cash Flow (OCF - CapEx)
+    dividend_payments: Optional[float] = None  # Cash Paid for Dividends
 
 class FinancialStatement(BaseModel):
     """Composite model for a full financial statement for one period."""
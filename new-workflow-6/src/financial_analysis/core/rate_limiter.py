@@ -0,0 +1,51 @@
+# File: src/financial_analysis/core/rate_limiter.py
+# Purpose: Request throttling primitives for rate-limited external APIs.
+
+import asyncio
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    A minimal token-bucket rate limiter for synchronous callers.
+
+    Enforces a minimum interval of 1/max_rps between acquisitions, so bursts
+    up to the configured rate are allowed while the long-run average never
+    exceeds it. Callers should invoke wait() only on the network path — cache
+    hits must not be throttled.
+    """
+
+    def __init__(self, max_rps: float):
+        self._min_interval = 1.0 / max_rps
+        self._lock = threading.Lock()
+        self._last_request = 0.0
+
+    def wait(self) -> None:
+        """Blocks until a request slot is available, then claims it."""
+        with self._lock:
+            now = time.monotonic()
+            delay = self._last_request + self._min_interval - now
+            if delay > 0:
+                time.sleep(delay)
+                now = time.monotonic()
+            self._last_request = now
+
+
+class AsyncTokenBucket:
+    """Asyncio counterpart of TokenBucket for the async providers."""
+
+    def __init__(self, max_rps: float):
+        self._min_interval = 1.0 / max_rps
+        self._lock = asyncio.Lock()
+        self._last_request = 0.0
+
+    async def wait(self) -> None:
+        """Waits until a request slot is available, then claims it."""
+        async with self._lock:
+            now = time.monotonic()
+            delay = self._last_request + self._min_interval - now
+            if delay > 0:
+                await asyncio.sleep(delay)
+                now = time.monotonic()
+            self._last_request = now
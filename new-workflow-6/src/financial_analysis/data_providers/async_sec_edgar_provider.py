@@ -0,0 +1,226 @@
+# File: src/financial_analysis/data_providers/async_sec_edgar_provider.py
+# Purpose: Asynchronous SEC EDGAR provider for concurrent multi-ticker fetching.
+
+import asyncio
+import logging
+import orjson
+import redis
+import httpx
+from typing import List, Dict, Any, Optional
+
+from ..core.models import CompanyInfo, FinancialStatement
+from .base_provider import DataProviderError
+from .sec_edgar_provider import (
+    SecEdgarProvider,
+    aggregate_annual_facts,
+    statements_from_annual,
+    _load_cached_annual,
+    _store_cached_annual,
+    _fresh_key,
+    _etag_key,
+    _lastmod_key,
+    _compress,
+    _decompress,
+    _flatten_cik_map,
+    _read_fresh_cik_map,
+    _write_cik_map_cache,
+)
+from ..core.config import settings
+from ..core.rate_limiter import AsyncTokenBucket
+
+logger = logging.getLogger(__name__)
+
+# SEC EDGAR allows at most 10 requests per second; the semaphore bounds
+# in-flight requests so concurrent tickers cannot exceed that ceiling.
+MAX_CONCURRENT_REQUESTS = 10
+
+
+class AsyncSecEdgarProvider:
+    """
+    Asynchronous sibling of SecEdgarProvider built on httpx with HTTP/2.
+
+    Exposes the same data contract as BaseDataProvider but with `async def`
+    methods, so multiple tickers (or multiple endpoints for one ticker) can be
+    fetched concurrently via asyncio.gather while a bounded semaphore keeps
+    the request rate within SEC's published limits. HTTP/2 multiplexes those
+    concurrent fetches over a single TLS connection, so a batch pays one
+    handshake instead of one per pooled socket.
+    """
+
+    BASE_URL = SecEdgarProvider.BASE_URL
+    CIK_MAP_URL = SecEdgarProvider.CIK_MAP_URL
+
+    def __init__(self):
+        self._client: Optional[httpx.AsyncClient] = None
+        self._sem = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        self._limiter = AsyncTokenBucket(settings.SEC_MAX_RPS)
+        self._cik_map: Optional[Dict[str, Any]] = None
+        self._cik_map_lock = asyncio.Lock()
+
+        try:
+            self._redis_client = redis.Redis(
+                host=settings.REDIS_HOST,
+                port=settings.REDIS_PORT,
+                db=settings.REDIS_DB,
+                decode_responses=False  # raw bytes in/out; orjson handles decoding
+            )
+            self._redis_client.ping()
+            logger.info("Successfully connected to Redis cache.")
+        except redis.exceptions.ConnectionError as e:
+            logger.warning(f"Could not connect to Redis at {settings.REDIS_HOST}:{settings.REDIS_PORT}. Caching will be disabled. Error: {e}")
+            self._redis_client = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Lazily creates the shared HTTP/2 client."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                headers={
+                    "User-Agent": settings.SEC_USER_AGENT,
+                    "Accept-Encoding": "gzip, deflate",
+                },
+                limits=httpx.Limits(max_connections=MAX_CONCURRENT_REQUESTS),
+                timeout=30.0,
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Closes the underlying HTTP client. Call once when finished."""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+
+    async def _get_with_cache(self, cache_key: str, url: str) -> Dict[str, Any]:
+        """
+        Generic getter that checks cache first, then falls back to HTTP GET.
+
+        Mirrors the sync provider's conditional-GET scheme: bodies persist
+        with their ETag/Last-Modified validators, a freshness marker carries
+        the TTL, and a 304 revalidation reuses the cached body.
+        """
+        cached_data = None
+        if self._redis_client:
+            cached_data = self._redis_client.get(cache_key)
+            if cached_data and self._redis_client.exists(_fresh_key(cache_key)):
+                logger.info(f"Cache HIT for key: {cache_key}")
+                return orjson.loads(_decompress(cached_data))
+
+        headers = {}
+        if cached_data is not None:
+            etag = self._redis_client.get(_etag_key(cache_key))
+            last_modified = self._redis_client.get(_lastmod_key(cache_key))
+            if etag:
+                headers["If-None-Match"] = etag.decode()
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified.decode()
+
+        logger.info(f"Cache MISS for key: {cache_key}. Fetching from URL: {url}")
+        client = self._get_client()
+        try:
+            async with self._sem:
+                # Throttle only actual network requests; cache hits return above untouched.
+                await self._limiter.wait()
+                response = await client.get(url, headers=headers or None)
+                if response.status_code == 304 and cached_data is not None:
+                    logger.info(f"Cache REVALIDATED (304) for key: {cache_key}")
+                    self._redis_client.setex(_fresh_key(cache_key), settings.REDIS_CACHE_EXPIRATION_SECONDS, b"1")
+                    return orjson.loads(_decompress(cached_data))
+                response.raise_for_status()
+                raw = response.content
+                response_headers = response.headers
+            data = orjson.loads(raw)
+
+            if self._redis_client:
+                # Store the response bytes verbatim - no re-serialization round-trip.
+                pipe = self._redis_client.pipeline()
+                pipe.set(cache_key, _compress(raw))
+                pipe.setex(_fresh_key(cache_key), settings.REDIS_CACHE_EXPIRATION_SECONDS, b"1")
+                etag = response_headers.get("ETag")
+                if etag:
+                    pipe.set(_etag_key(cache_key), etag)
+                last_modified = response_headers.get("Last-Modified")
+                if last_modified:
+                    pipe.set(_lastmod_key(cache_key), last_modified)
+                pipe.execute()
+            return data
+        except httpx.HTTPError as e:
+            logger.error(f"HTTP request failed for URL {url}: {e}")
+            raise DataProviderError(f"Network request failed for {url}: {e}")
+
+    async def _load_cik_map(self) -> Dict[str, Any]:
+        async with self._cik_map_lock:
+            if self._cik_map:
+                return self._cik_map
+
+            cik_map = _read_fresh_cik_map()
+            if cik_map is not None:
+                self._cik_map = cik_map
+                logger.info(f"Loaded CIK map for {len(cik_map)} tickers from disk cache.")
+                return cik_map
+
+            cache_key = "sec:cik_map"
+            data = await self._get_with_cache(cache_key, self.CIK_MAP_URL)
+
+            self._cik_map = _flatten_cik_map(data)
+            _write_cik_map_cache(self._cik_map)
+            logger.info(f"Successfully loaded CIK map for {len(self._cik_map)} tickers.")
+            return self._cik_map
+
+    async def _get_company_facts(self, cik: str) -> Dict[str, Any]:
+        cache_key = f"sec:facts:{cik}"
+        facts_url = f"{self.BASE_URL}/api/xbrl/companyfacts/CIK{cik}.json"
+        return await self._get_with_cache(cache_key, facts_url)
+
+    async def _get_cik(self, ticker: str) -> str:
+        cik_map = await self._load_cik_map()
+        try:
+            return cik_map[ticker.upper()][0]
+        except KeyError:
+            raise DataProviderError(f"Ticker '{ticker.upper()}' not found in SEC CIK mapping.")
+
+    async def get_company_info(self, ticker: str) -> CompanyInfo:
+        logger.info(f"Getting company info for {ticker} from async SEC provider.")
+        cik_map = await self._load_cik_map()
+        ticker_upper = ticker.upper()
+        try:
+            cik, title, exchange = cik_map[ticker_upper]
+        except KeyError:
+            raise DataProviderError(f"Ticker '{ticker_upper}' not found in SEC CIK mapping.")
+        return CompanyInfo(ticker=ticker_upper, name=title, cik=cik, exchange=exchange)
+
+    async def get_financial_statements(self, ticker: str, num_years: int) -> List[FinancialStatement]:
+        logger.info(f"Getting financial statements for {ticker} from async SEC provider.")
+        cik = await self._get_cik(ticker)
+
+        # Fast tier: pre-aggregated annual data. A hit skips both the multi-MB
+        # facts download/decode and the whole XBRL aggregation pass.
+        cached = _load_cached_annual(self._redis_client, cik)
+        if cached is not None:
+            annual_data, end_dates = cached
+        else:
+            facts = await self._get_company_facts(cik)
+            annual_data, end_dates = aggregate_annual_facts(cik, facts)
+            _store_cached_annual(self._redis_client, cik, annual_data, end_dates)
+
+        return statements_from_annual(ticker, cik, annual_data, end_dates, num_years)
+
+    async def get_financial_statements_many(
+        self, tickers: List[str], num_years: int
+    ) -> Dict[str, List[FinancialStatement]]:
+        """
+        Fetches statements for many tickers concurrently over one connection.
+
+        All fetches share the HTTP/2 client, so the semaphore's in-flight cap
+        maps to multiplexed streams rather than extra sockets. Failed tickers
+        are logged and omitted instead of failing the whole batch.
+        """
+        results = await asyncio.gather(
+            *(self.get_financial_statements(ticker, num_years) for ticker in tickers),
+            return_exceptions=True,
+        )
+        statements_by_ticker: Dict[str, List[FinancialStatement]] = {}
+        for ticker, result in zip(tickers, results):
+            if isinstance(result, BaseException):
+                logger.warning(f"Batch statement fetch failed for '{ticker}': {result}")
+            else:
+                statements_by_ticker[ticker] = result
+        return statements_by_ticker
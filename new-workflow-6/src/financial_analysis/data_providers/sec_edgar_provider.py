@@ -3,21 +3,36 @@
 
 import requests
 import logging
-import json
+import ijson
+import orjson
+import os
+import pickle
 import redis
+import time
+import zstandard as zstd
+from email.utils import formatdate
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import List, Dict, Any, Optional
 from datetime import datetime
-from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+import numpy as np
 
 from ..core.models import (
     CompanyInfo, FinancialStatement, IncomeStatement, BalanceSheet, CashFlowStatement
 )
 from .base_provider import BaseDataProvider, DataProviderError
 from ..core.config import settings
+from ..core.rate_limiter import TokenBucket
 
 logger = logging.getLogger(__name__)
 
 # MODIFIED: Expanded the tag map with more common aliases to improve parsing robustness.
+# Tags are listed in preference order: for each metric and fiscal year the
+# highest-priority tag with data wins. Alias tags are alternative spellings of
+# the SAME number, so they must never be summed with each other.
 XBRL_TAG_MAP = {
     # Income Statement
     "revenue": ["Revenues", "SalesRevenueNet", "TotalRevenues", "RevenueFromContractWithCustomerExcludingAssessedTax"],
@@ -36,7 +51,7 @@ XBRL_TAG_MAP = {
     "total_assets": ["Assets"],
     "current_liabilities": ["LiabilitiesCurrent"],
     "total_liabilities": ["Liabilities"],
-    "total_debt": ["DebtCurrent", "LongTermDebt", "LongTermDebtAndCapitalLeaseObligations", "LongTermDebtNoncurrent"],
+    "total_debt": [],  # derived: see _DEBT_COMPONENT_TAGS below
     "shareholders_equity": ["StockholdersEquity", "StockholdersEquityIncludingPortionAttributableToNoncontrollingInterest"],
     "shares_outstanding": ["WeightedAverageNumberOfDilutedSharesOutstanding", "WeightedAverageNumberOfSharesOutstandingBasic"],
     # Cash Flow Statement
@@ -45,24 +60,243 @@ XBRL_TAG_MAP = {
     "dividend_payments": ["PaymentsOfDividends"],
 }
 
+# total_debt is the one genuinely additive metric: current debt plus the
+# preferred long-term tag. The long-term entries are aliases of each other,
+# so only the best-priority one per year contributes to the sum.
+_DEBT_COMPONENT_TAGS = {
+    "_debt_current": ["DebtCurrent"],
+    "_debt_long_term": ["LongTermDebt", "LongTermDebtAndCapitalLeaseObligations", "LongTermDebtNoncurrent"],
+}
+
+# Inverted index: XBRL tag -> metric name (including the internal debt
+# components). Built once at import so the facts walk is a single dict probe
+# per tag instead of an O(metrics x tags) scan.
+_TAG_TO_METRIC: Dict[str, str] = {
+    tag: metric
+    for mapping in (XBRL_TAG_MAP, _DEBT_COMPONENT_TAGS)
+    for metric, tags in mapping.items()
+    for tag in tags
+}
+
+# Tag -> preference rank within its metric's alias list (lower wins).
+_TAG_PRIORITY: Dict[str, int] = {
+    tag: rank
+    for mapping in (XBRL_TAG_MAP, _DEBT_COMPONENT_TAGS)
+    for tags in mapping.values()
+    for rank, tag in enumerate(tags)
+}
+
+# Column layout for the per-company metric matrix (years x metrics). Staging
+# the history as one float64 array keeps the data in structure-of-arrays form
+# so batch consumers (e.g. vectorized ratio math) can broadcast over it.
+_METRIC_ORDER: List[str] = list(XBRL_TAG_MAP.keys())
+_METRIC_INDEX: Dict[str, int] = {metric: i for i, metric in enumerate(_METRIC_ORDER)}
+
+
+def annual_matrix(annual_data: Dict[int, Dict[str, float]], years: List[int]) -> np.ndarray:
+    """Packs per-year metric dicts into a (len(years), len(_METRIC_ORDER)) array."""
+    arr = np.full((len(years), len(_METRIC_ORDER)), np.nan, dtype=np.float64)
+    for row, year in enumerate(years):
+        for metric, val in annual_data.get(year, {}).items():
+            idx = _METRIC_INDEX.get(metric)
+            if idx is not None:
+                arr[row, idx] = val
+    return arr
+
+
+# Bump whenever XBRL_TAG_MAP (and hence the aggregated schema) changes, so
+# stale pre-aggregated cache entries are ignored rather than misread.
+_ANNUAL_SCHEMA_VERSION = 3
+
+
+def _annual_cache_key(cik: str) -> str:
+    return f"sec:annual:{cik}:v{_ANNUAL_SCHEMA_VERSION}"
+
+
+# zstd magic number; lets reads transparently handle entries written before
+# compression was introduced.
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+def _compress(raw: bytes) -> bytes:
+    """Compresses a cache payload; companyfacts JSON shrinks ~10-20x."""
+    # Compressor contexts are not thread-safe, so build one per call.
+    return zstd.ZstdCompressor(level=3).compress(raw)
+
+
+def _decompress(blob: bytes) -> bytes:
+    """Decompresses a cache payload, passing uncompressed legacy entries through."""
+    if not blob.startswith(_ZSTD_MAGIC):
+        return blob
+    return zstd.ZstdDecompressor().decompress(blob)
+
+
+def _fresh_key(cache_key: str) -> str:
+    return f"{cache_key}:fresh"
+
+
+def _etag_key(cache_key: str) -> str:
+    return f"{cache_key}:etag"
+
+
+def _lastmod_key(cache_key: str) -> str:
+    return f"{cache_key}:lastmod"
+
+
+def _load_cached_annual(redis_client, cik: str):
+    """Returns (annual_data, end_dates) from the pre-aggregated cache tier, or None."""
+    if not redis_client:
+        return None
+    cached = redis_client.get(_annual_cache_key(cik))
+    if not cached:
+        return None
+    payload = orjson.loads(_decompress(cached))
+    annual_data = {int(fy): metrics for fy, metrics in payload["annual"].items()}
+    end_dates = {int(fy): _parse_end(end) for fy, end in payload["end_dates"].items()}
+    logger.info(f"Cache HIT for pre-aggregated annual data of CIK {cik}.")
+    return annual_data, end_dates
+
+
+def _store_cached_annual(redis_client, cik: str, annual_data, end_dates) -> None:
+    """Caches the aggregated annual data (a few KB vs the multi-MB raw facts)."""
+    if not redis_client:
+        return
+    payload = {
+        "annual": annual_data,
+        "end_dates": {fy: end.strftime("%Y-%m-%d") for fy, end in end_dates.items()},
+    }
+    redis_client.setex(
+        _annual_cache_key(cik),
+        settings.REDIS_CACHE_EXPIRATION_SECONDS,
+        # Fiscal-year keys are ints; orjson refuses non-string dict keys
+        # unless told to stringify them (the read side int()s them back).
+        _compress(orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)),
+    )
+
+
+@lru_cache(maxsize=512)
+def _parse_end(s: str) -> datetime:
+    """Parses an XBRL 'end' date string, memoized: SEC repeats the same few
+    dozen end dates across thousands of facts. fromisoformat is a dedicated
+    C fast path, several times quicker than the strptime format machinery."""
+    return datetime.fromisoformat(s)
+
+
+def _facts_cache_path(cik: str):
+    return settings.CACHE_DIR / f"companyfacts_{cik}.json.zst"
+
+
+def _read_fresh_facts(cik: str) -> Optional[Dict[str, Any]]:
+    """Returns the on-disk facts dict for a CIK if it is younger than the TTL."""
+    path = _facts_cache_path(cik)
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    if time.time() - st.st_mtime >= settings.REDIS_CACHE_EXPIRATION_SECONDS:
+        return None
+    try:
+        with open(path, "rb") as f:
+            return orjson.loads(_decompress(f.read()))
+    except (OSError, orjson.JSONDecodeError, zstd.ZstdError):
+        return None
+
+
+def _write_facts_cache(cik: str, facts_bytes: bytes, etag: Optional[str]) -> None:
+    """Atomically persists a (filtered) facts payload plus its ETag sidecar."""
+    path = _facts_cache_path(cik)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".zst.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(_compress(facts_bytes))
+        os.replace(tmp_path, path)
+        if etag:
+            path.with_suffix(".etag").write_text(etag)
+    except OSError as e:
+        logger.warning(f"Could not write facts cache to {path}: {e}")
+
+
+def _read_fresh_cik_map() -> Optional[Dict[str, Any]]:
+    """Returns the pickled on-disk CIK map if it is younger than the cache TTL."""
+    path = settings.CIK_MAP_CACHE_FILE
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    if time.time() - st.st_mtime >= settings.REDIS_CACHE_EXPIRATION_SECONDS:
+        return None
+    try:
+        with open(path, "rb") as f:
+            cik_map = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return None
+    # Ignore pickles from before the map was flattened to tuples.
+    if cik_map and not isinstance(next(iter(cik_map.values())), tuple):
+        return None
+    return cik_map
+
+
+def _flatten_cik_map(data: Dict[str, Any]) -> Dict[str, "tuple[str, str, str]"]:
+    """
+    Flattens the raw SEC company list to {TICKER: (cik_padded, title, exchange)}.
+
+    Storing compact tuples instead of per-company dicts cuts the map's memory
+    roughly 3x and moves the zfill/str normalization out of the per-call path.
+    """
+    return {
+        company['ticker'].upper(): (
+            str(company['cik_str']).zfill(10),
+            company.get('title', 'N/A'),
+            company.get('exchange', 'N/A'),
+        )
+        for company in data.values()
+    }
+
+
+def _write_cik_map_cache(cik_map: Dict[str, Any]) -> None:
+    """Atomically persists the parsed CIK map so later process starts skip the fetch."""
+    path = settings.CIK_MAP_CACHE_FILE
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".pkl.tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump(cik_map, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning(f"Could not write CIK map cache to {path}: {e}")
+
 
 class SecEdgarProvider(BaseDataProvider):
     """Provides financial data by fetching it from the SEC EDGAR API, with Redis caching."""
     
     BASE_URL = "https://data.sec.gov"
     CIK_MAP_URL = "https://www.sec.gov/files/company_tickers.json"
+    MAX_FETCH_WORKERS = 8  # below the SEC fair-access ceiling enforced by the token bucket
 
     def __init__(self):
         self._session = requests.Session()
-        self._session.headers.update({"User-Agent": settings.SEC_USER_AGENT})
+        self._session.headers.update({
+            "User-Agent": settings.SEC_USER_AGENT,
+            "Accept-Encoding": "gzip, deflate",
+        })
+        # A larger keep-alive pool avoids paying the TCP+TLS handshake (~2 RTTs)
+        # on every request, and transient SEC errors are retried with backoff.
+        adapter = HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=20,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504]),
+        )
+        self._session.mount("https://", adapter)
         self._cik_map = None
+        self._limiter = TokenBucket(settings.SEC_MAX_RPS)
         
         try:
             self._redis_client = redis.Redis(
                 host=settings.REDIS_HOST,
                 port=settings.REDIS_PORT,
                 db=settings.REDIS_DB,
-                decode_responses=True
+                decode_responses=False  # raw bytes in/out; orjson handles decoding
             )
             self._redis_client.ping()
             logger.info("Successfully connected to Redis cache.")
@@ -71,112 +305,394 @@ class SecEdgarProvider(BaseDataProvider):
             self._redis_client = None
 
     def _get_with_cache(self, cache_key: str, url: str) -> Dict[str, Any]:
-        """Generic getter that checks cache first, then falls back to HTTP GET."""
+        """
+        Generic getter that checks cache first, then falls back to HTTP GET.
+
+        Bodies are stored without a TTL alongside their ETag/Last-Modified
+        validators; a separate freshness marker carries the TTL. When the
+        marker lapses, a conditional GET lets the SEC answer with a ~200-byte
+        304 and the cached body is reused instead of re-downloading it.
+        """
+        cached_data = None
         if self._redis_client:
             cached_data = self._redis_client.get(cache_key)
-            if cached_data:
+            if cached_data and self._redis_client.exists(_fresh_key(cache_key)):
                 logger.info(f"Cache HIT for key: {cache_key}")
-                return json.loads(cached_data)
-        
+                return orjson.loads(_decompress(cached_data))
+
+        headers = self._conditional_headers(cache_key, cached_data)
+
         logger.info(f"Cache MISS for key: {cache_key}. Fetching from URL: {url}")
         try:
-            response = self._session.get(url)
+            # Throttle only actual network requests; cache hits return above untouched.
+            self._limiter.wait()
+            response = self._session.get(url, headers=headers or None)
+
+            if response.status_code == 304 and cached_data is not None:
+                logger.info(f"Cache REVALIDATED (304) for key: {cache_key}")
+                self._redis_client.setex(_fresh_key(cache_key), settings.REDIS_CACHE_EXPIRATION_SECONDS, b"1")
+                return orjson.loads(_decompress(cached_data))
+
             response.raise_for_status()
-            data = response.json()
+            raw = response.content
+            data = orjson.loads(raw)
             
             if self._redis_client:
-                self._redis_client.setex(
-                    cache_key,
-                    settings.REDIS_CACHE_EXPIRATION_SECONDS,
-                    json.dumps(data)
-                )
+                # Store the response bytes verbatim - no re-serialization round-trip.
+                self._store_response(cache_key, raw, response.headers)
             return data
         except requests.exceptions.RequestException as e:
             logger.error(f"HTTP request failed for URL {url}: {e}")
             raise DataProviderError(f"Network request failed for {url}: {e}")
 
+    def _conditional_headers(self, cache_key: str, cached_data) -> Dict[str, str]:
+        """Builds If-None-Match/If-Modified-Since headers for a stale cached body."""
+        headers: Dict[str, str] = {}
+        if cached_data is not None:
+            etag = self._redis_client.get(_etag_key(cache_key))
+            last_modified = self._redis_client.get(_lastmod_key(cache_key))
+            if etag:
+                headers["If-None-Match"] = etag.decode()
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified.decode()
+        return headers
+
+    def _store_response(self, cache_key: str, raw: bytes, response_headers) -> None:
+        """Stores a response body plus its HTTP validators in a single pipeline."""
+        pipe = self._redis_client.pipeline()
+        pipe.set(cache_key, _compress(raw))
+        pipe.setex(_fresh_key(cache_key), settings.REDIS_CACHE_EXPIRATION_SECONDS, b"1")
+        etag = response_headers.get("ETag")
+        if etag:
+            pipe.set(_etag_key(cache_key), etag)
+        last_modified = response_headers.get("Last-Modified")
+        if last_modified:
+            pipe.set(_lastmod_key(cache_key), last_modified)
+        pipe.execute()
+
     def _load_cik_map(self) -> Dict[str, Any]:
         if self._cik_map:
             return self._cik_map
-        
+
+        # Tier 1: on-disk pickle. A fresh copy (or a stale one the SEC confirms
+        # unchanged via If-Modified-Since) avoids both Redis and the network.
+        cik_map = _read_fresh_cik_map() or self._revalidate_disk_cik_map()
+        if cik_map is not None:
+            self._cik_map = cik_map
+            logger.info(f"Loaded CIK map for {len(cik_map)} tickers from disk cache.")
+            return cik_map
+
+        # Tier 2: Redis / network.
         cache_key = "sec:cik_map"
         data = self._get_with_cache(cache_key, self.CIK_MAP_URL)
         
-        self._cik_map = {company['ticker']: company for company in data.values()}
+        self._cik_map = _flatten_cik_map(data)
+        _write_cik_map_cache(self._cik_map)
         logger.info(f"Successfully loaded CIK map for {len(self._cik_map)} tickers.")
         return self._cik_map
 
+    def _revalidate_disk_cik_map(self) -> Optional[Dict[str, Any]]:
+        """
+        Checks a stale on-disk CIK map against the SEC with If-Modified-Since.
+        On a 304 the pickle's mtime is refreshed and it is reused as-is.
+        """
+        path = settings.CIK_MAP_CACHE_FILE
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        try:
+            self._limiter.wait()
+            response = self._session.head(
+                self.CIK_MAP_URL,
+                headers={"If-Modified-Since": formatdate(st.st_mtime, usegmt=True)},
+            )
+        except requests.exceptions.RequestException:
+            return None
+        if response.status_code != 304:
+            return None
+        os.utime(path)
+        try:
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+
     def _get_company_facts(self, cik: str) -> Dict[str, Any]:
+        """
+        Fetches company facts, streaming the multi-MB payload with ijson.
+
+        Only the ~30 us-gaap tags in _TAG_TO_METRIC are kept, so peak memory
+        is bounded by the relevant slice (tens of KB) instead of the full
+        parsed document, and the cache stores the slim dict rather than the
+        raw blob.
+        """
         cache_key = f"sec:facts:{cik}"
         facts_url = f"{self.BASE_URL}/api/xbrl/companyfacts/CIK{cik}.json"
-        return self._get_with_cache(cache_key, facts_url)
+
+        # Tier 1: on-disk copy, fresh or confirmed unchanged via If-None-Match.
+        facts = _read_fresh_facts(cik) or self._revalidate_disk_facts(cik, facts_url)
+        if facts is not None:
+            logger.info(f"Loaded company facts for CIK {cik} from disk cache.")
+            return facts
+
+        cached_data = None
+        if self._redis_client:
+            cached_data = self._redis_client.get(cache_key)
+            if cached_data and self._redis_client.exists(_fresh_key(cache_key)):
+                logger.info(f"Cache HIT for key: {cache_key}")
+                return orjson.loads(_decompress(cached_data))
+
+        headers = self._conditional_headers(cache_key, cached_data)
+
+        logger.info(f"Cache MISS for key: {cache_key}. Streaming from URL: {facts_url}")
+        try:
+            self._limiter.wait()
+            response = self._session.get(facts_url, headers=headers or None, stream=True)
+
+            if response.status_code == 304 and cached_data is not None:
+                logger.info(f"Cache REVALIDATED (304) for key: {cache_key}")
+                self._redis_client.setex(_fresh_key(cache_key), settings.REDIS_CACHE_EXPIRATION_SECONDS, b"1")
+                return orjson.loads(_decompress(cached_data))
+
+            response.raise_for_status()
+            response.raw.decode_content = True
+            relevant = {}
+            for tag, tag_facts in ijson.kvitems(response.raw, "facts.us-gaap"):
+                if tag not in _TAG_TO_METRIC:
+                    continue
+                # Drop quarterly rows at stream time: only annual 10-K/FY
+                # entries survive to the cache, which shrinks stored facts
+                # by another ~4x on filers with long 10-Q histories.
+                usd = tag_facts.get("units", {}).get("USD")
+                if usd:
+                    tag_facts["units"]["USD"] = [
+                        item for item in usd
+                        if item.get("form") == "10-K" and item.get("fp") == "FY"
+                    ]
+                relevant[tag] = tag_facts
+            facts = {"facts": {"us-gaap": relevant}}
+
+            facts_bytes = orjson.dumps(facts)
+            _write_facts_cache(cik, facts_bytes, response.headers.get("ETag"))
+            if self._redis_client:
+                self._store_response(cache_key, facts_bytes, response.headers)
+            return facts
+        except (requests.exceptions.RequestException, ijson.JSONError) as e:
+            logger.error(f"HTTP request failed for URL {facts_url}: {e}")
+            raise DataProviderError(f"Network request failed for {facts_url}: {e}")
+
+    def _revalidate_disk_facts(self, cik: str, facts_url: str) -> Optional[Dict[str, Any]]:
+        """
+        Checks a stale on-disk facts file against the SEC with If-None-Match.
+        On a 304 the file's mtime is refreshed and it is reused as-is.
+        """
+        path = _facts_cache_path(cik)
+        etag_path = path.with_suffix(".etag")
+        try:
+            path.stat()
+            etag = etag_path.read_text().strip()
+        except OSError:
+            return None
+        if not etag:
+            return None
+        try:
+            self._limiter.wait()
+            response = self._session.head(facts_url, headers={"If-None-Match": etag})
+        except requests.exceptions.RequestException:
+            return None
+        if response.status_code != 304:
+            return None
+        os.utime(path)
+        try:
+            with open(path, "rb") as f:
+                return orjson.loads(_decompress(f.read()))
+        except (OSError, orjson.JSONDecodeError, zstd.ZstdError):
+            return None
 
     def _get_cik(self, ticker: str) -> str:
-        ticker = ticker.upper()
-        cik_map = self._load_cik_map()
-        if ticker not in cik_map:
-            raise DataProviderError(f"Ticker '{ticker}' not found in SEC CIK mapping.")
-        cik_str = str(cik_map[ticker]['cik_str'])
-        return cik_str.zfill(10)
+        try:
+            return self._load_cik_map()[ticker.upper()][0]
+        except KeyError:
+            raise DataProviderError(f"Ticker '{ticker.upper()}' not found in SEC CIK mapping.")
 
     def get_company_info(self, ticker: str) -> CompanyInfo:
         logger.info(f"Getting company info for {ticker} from SEC provider.")
-        cik_map = self._load_cik_map()
         ticker_upper = ticker.upper()
-        if ticker_upper not in cik_map:
+        try:
+            cik, title, exchange = self._load_cik_map()[ticker_upper]
+        except KeyError:
             raise DataProviderError(f"Ticker '{ticker_upper}' not found in SEC CIK mapping.")
-        company_data = cik_map[ticker_upper]
-        return CompanyInfo(ticker=ticker_upper, name=company_data.get('title', 'N/A'), cik=str(company_data.get('cik_str')).zfill(10), exchange=company_data.get('exchange', 'N/A'))
+        return CompanyInfo(ticker=ticker_upper, name=title, cik=cik, exchange=exchange)
+
+    def _batch_get(self, keys: List[str]) -> Dict[str, Optional[bytes]]:
+        """Fetches many cache keys in one MGET round trip instead of N GETs."""
+        if not self._redis_client or not keys:
+            return {key: None for key in keys}
+        return dict(zip(keys, self._redis_client.mget(keys)))
+
+    def prewarm(self, tickers: List[str]) -> None:
+        """
+        Warms the facts cache for a batch of tickers.
+
+        All cache keys are probed with a single MGET, then only the missing
+        companies are fetched from the SEC. On a 100-ticker batch this turns
+        100 sequential Redis round trips into one before any HTTP work starts.
+        """
+        ciks = {}
+        for ticker in tickers:
+            try:
+                ciks[ticker] = self._get_cik(ticker)
+            except DataProviderError as e:
+                logger.warning(f"Skipping prewarm for '{ticker}': {e}")
+
+        keys = [f"sec:facts:{cik}" for cik in ciks.values()]
+        cached = self._batch_get(keys)
+        missing = [cik for cik in ciks.values() if not cached.get(f"sec:facts:{cik}")]
+        logger.info(f"Prewarm: {len(keys) - len(missing)} of {len(keys)} facts already cached.")
+        if not missing:
+            return
+
+        # Fetch the misses concurrently: the work is pure socket wait (GIL
+        # released) and the shared TokenBucket keeps the aggregate request
+        # rate under the SEC ceiling regardless of worker count.
+        def fetch(cik: str) -> None:
+            try:
+                self._get_company_facts(cik)
+            except DataProviderError as e:
+                logger.warning(f"Prewarm fetch failed for CIK {cik}: {e}")
+
+        with ThreadPoolExecutor(max_workers=self.MAX_FETCH_WORKERS) as pool:
+            list(pool.map(fetch, missing))
+
+    def get_financial_statements_batch(
+        self, tickers: List[str], num_years: int
+    ) -> Dict[str, List[FinancialStatement]]:
+        """
+        Fetches statements for many tickers with overlapped HTTP latency.
+
+        CIK resolution is done up front (all local once the map is loaded),
+        then per-company facts downloads run on a thread pool sharing this
+        provider's session and rate limiter. Failed tickers are logged and
+        omitted from the result rather than failing the whole batch.
+        """
+        self._load_cik_map()
+        results: Dict[str, List[FinancialStatement]] = {}
+
+        def fetch(ticker: str):
+            return ticker, self.get_financial_statements(ticker, num_years)
+
+        with ThreadPoolExecutor(max_workers=self.MAX_FETCH_WORKERS) as pool:
+            futures = [pool.submit(fetch, ticker) for ticker in tickers]
+            for future in futures:
+                try:
+                    ticker, statements = future.result()
+                    results[ticker] = statements
+                except DataProviderError as e:
+                    logger.warning(f"Batch statement fetch failed: {e}")
+        return results
 
     def get_financial_statements(self, ticker: str, num_years: int) -> List[FinancialStatement]:
         logger.info(f"Getting financial statements for {ticker} from SEC provider.")
         cik = self._get_cik(ticker)
-        facts = self._get_company_facts(cik)
-        if "facts" not in facts or "us-gaap" not in facts["facts"]:
-            raise DataProviderError(f"No US-GAAP facts found for CIK {cik}.")
-        gaap_facts = facts["facts"]["us-gaap"]
-        
-        def get_fact_data(metric_key: str) -> List[Dict]:
-            """Finds all matching tags and returns their data lists."""
-            all_items = []
-            for tag in XBRL_TAG_MAP.get(metric_key, []):
-                if tag in gaap_facts and "units" in gaap_facts[tag] and "USD" in gaap_facts[tag]["units"]:
-                    all_items.extend(gaap_facts[tag]["units"]["USD"])
-            return all_items
-
-        annual_data = defaultdict(lambda: defaultdict(dict))
-        
-        # Aggregate data from all possible tags
-        aggregated_facts = defaultdict(list)
-        for metric in XBRL_TAG_MAP:
-            aggregated_facts[metric] = get_fact_data(metric)
-            
-        # Group by fiscal year
-        for metric, items in aggregated_facts.items():
-            for item in items:
-                if item.get("form") == "10-K" and item.get("fp") == "FY":
-                    fy = item["fy"]
-                    # Sum values if multiple tags contribute to one metric (e.g., total_debt)
-                    annual_data[fy][metric] = annual_data[fy].get(metric, 0) + item["val"]
-                    if "end_date" not in annual_data[fy]:
-                         annual_data[fy]["end_date"] = datetime.strptime(item["end"], "%Y-%m-%d")
-
-        statements = []
-        sorted_years = sorted(annual_data.keys(), reverse=True)
-        
-        for year in sorted_years[:num_years]:
-            data = annual_data[year]
-            if "end_date" not in data: continue # Skip years with incomplete data
-            
-            def d(key): return data.get(key)
-            
-            income_stmt = IncomeStatement(revenue=d("revenue"), cost_of_goods_sold=d("cost_of_goods_sold"), gross_profit=d("gross_profit"), operating_income=d("operating_income"), interest_expense=d("interest_expense"), net_income=d("net_income"), eps_diluted=d("eps_diluted"), eps_basic=d("eps_basic"))
-            balance_sheet = BalanceSheet(total_assets=d("total_assets"), current_assets=d("current_assets"), cash_and_equivalents=d("cash_and_equivalents"), inventory=d("inventory"), accounts_receivable=d("accounts_receivable"), total_liabilities=d("total_liabilities"), current_liabilities=d("current_liabilities"), total_debt=d("total_debt"), shareholders_equity=d("shareholders_equity"), shares_outstanding=d("shares_outstanding"))
-            cash_flow_stmt = CashFlowStatement(operating_cash_flow=d("operating_cash_flow"), capital_expenditures=d("capital_expenditures"), dividend_payments=d("dividend_payments"))
-            
-            statements.append(FinancialStatement(ticker=ticker.upper(), period="FY", fiscal_year=year, end_date=data["end_date"], income_statement=income_stmt, balance_sheet=balance_sheet, cash_flow_statement=cash_flow_stmt, source_url=f"{self.BASE_URL}/api/xbrl/companyfacts/CIK{cik}.json"))
-            
-        if not statements:
-            raise DataProviderError(f"Could not construct any financial statements for {ticker}. The company might not file 10-Ks or data is unavailable.")
-        
-        return statements
+
+        # Fast tier: pre-aggregated annual data. A hit skips both the multi-MB
+        # facts download/decode and the whole XBRL aggregation pass.
+        cached = _load_cached_annual(self._redis_client, cik)
+        if cached is not None:
+            annual_data, end_dates = cached
+        else:
+            facts = self._get_company_facts(cik)
+            annual_data, end_dates = aggregate_annual_facts(cik, facts)
+            _store_cached_annual(self._redis_client, cik, annual_data, end_dates)
+
+        return statements_from_annual(ticker, cik, annual_data, end_dates, num_years)
+
+
+def aggregate_annual_facts(cik: str, facts: Dict[str, Any]) -> "tuple[Dict[int, Dict[str, float]], Dict[int, datetime]]":
+    """Reduces a raw company-facts payload to per-year metric totals and end dates."""
+    if "facts" not in facts or "us-gaap" not in facts["facts"]:
+        raise DataProviderError(f"No US-GAAP facts found for CIK {cik}.")
+    gaap_facts = facts["facts"]["us-gaap"]
+
+    # Fused single pass over the facts: aggregate directly into the per-year
+    # buckets instead of materializing an intermediate row list and pivoting.
+    # This halves the memory traffic over the multi-MB gaap_facts working set.
+    annual_data: Dict[int, Dict[str, float]] = {}
+    end_dates: Dict[int, datetime] = {}
+    # (fy, metric) -> (tag rank, period end) currently backing the value, so a
+    # better alias can overwrite and a worse one is ignored.
+    chosen: Dict["tuple[int, str]", "tuple[int, datetime]"] = {}
+    for tag, tag_facts in gaap_facts.items():
+        metric = _TAG_TO_METRIC.get(tag)
+        if metric is None:
+            continue
+        rank = _TAG_PRIORITY[tag]
+        for item in tag_facts.get("units", {}).get("USD", ()):
+            # Reject non-annual rows before touching anything else; the vast
+            # majority of facts are 10-Q entries and never pass this gate.
+            if item.get("form") != "10-K" or item.get("fp") != "FY":
+                continue
+            fy = item["fy"]
+            end = _parse_end(item["end"])
+            # get + explicit insert rather than setdefault: the latter would
+            # allocate a throwaway empty dict on every row that hits an
+            # existing year, which is almost all of them.
+            bucket = annual_data.get(fy)
+            if bucket is None:
+                bucket = annual_data[fy] = {}
+            # Alias tags report the same number under different names, so the
+            # best-ranked tag with data wins rather than summing duplicates.
+            # Within that tag a 10-K also restates its comparative periods
+            # under the same fy, so the latest period end is the one that
+            # actually belongs to this fiscal year.
+            prev = chosen.get((fy, metric))
+            if prev is None or rank < prev[0] or (rank == prev[0] and end > prev[1]):
+                bucket[metric] = item["val"]
+                chosen[(fy, metric)] = (rank, end)
+            if fy not in end_dates or end > end_dates[fy]:
+                end_dates[fy] = end
+
+    # total_debt is genuinely additive: current debt plus the preferred
+    # long-term component, either of which may be absent.
+    for bucket in annual_data.values():
+        debt_current = bucket.pop("_debt_current", None)
+        debt_long_term = bucket.pop("_debt_long_term", None)
+        if debt_current is not None or debt_long_term is not None:
+            bucket["total_debt"] = (debt_current or 0.0) + (debt_long_term or 0.0)
+
+    return annual_data, end_dates
+
+
+def statements_from_annual(
+    ticker: str,
+    cik: str,
+    annual_data: Dict[int, Dict[str, float]],
+    end_dates: Dict[int, datetime],
+    num_years: int,
+) -> List[FinancialStatement]:
+    """Constructs FinancialStatement objects from pre-aggregated annual data."""
+    statements = []
+    # Skip years with incomplete data (no known period end date).
+    years = [y for y in sorted(annual_data.keys(), reverse=True)[:num_years] if y in end_dates]
+    matrix = annual_matrix(annual_data, years)
+
+    for row, year in enumerate(years):
+        values = matrix[row]
+
+        def d(key):
+            val = values[_METRIC_INDEX[key]]
+            return None if np.isnan(val) else float(val)
+
+        # XBRL USD facts are already numeric; the slotted dataclass constructors
+        # are cheap, and FinancialStatement.model_construct skips re-validation.
+        income_stmt = IncomeStatement(revenue=d("revenue"), cost_of_goods_sold=d("cost_of_goods_sold"), gross_profit=d("gross_profit"), operating_income=d("operating_income"), interest_expense=d("interest_expense"), net_income=d("net_income"), eps_diluted=d("eps_diluted"), eps_basic=d("eps_basic"))
+        balance_sheet = BalanceSheet(total_assets=d("total_assets"), current_assets=d("current_assets"), cash_and_equivalents=d("cash_and_equivalents"), inventory=d("inventory"), accounts_receivable=d("accounts_receivable"), total_liabilities=d("total_liabilities"), current_liabilities=d("current_liabilities"), total_debt=d("total_debt"), shareholders_equity=d("shareholders_equity"), shares_outstanding=d("shares_outstanding"))
+        cash_flow_stmt = CashFlowStatement(operating_cash_flow=d("operating_cash_flow"), capital_expenditures=d("capital_expenditures"), dividend_payments=d("dividend_payments"))
+
+        statements.append(FinancialStatement.model_construct(ticker=ticker.upper(), period="FY", fiscal_year=year, end_date=end_dates[year], income_statement=income_stmt, balance_sheet=balance_sheet, cash_flow_statement=cash_flow_stmt, source_url=f"{SecEdgarProvider.BASE_URL}/api/xbrl/companyfacts/CIK{cik}.json"))
+
+    if not statements:
+        raise DataProviderError(f"Could not construct any financial statements for {ticker}. The company might not file 10-Ks or data is unavailable.")
+
+    return statements
@@ -1,12 +1,16 @@
 # File: src/financial_analysis/data_providers/yfinance_provider.py
 # Purpose: Implements a data provider using the yfinance library.
 
-import yfinance as yf
-import pandas as pd
+from __future__ import annotations
+
 import logging
-from typing import List, Dict, Any, Optional
+from typing import TYPE_CHECKING, List, Dict, Any, Optional
 from datetime import datetime
 
+if TYPE_CHECKING:
+    import pandas as pd
+    import yfinance as yf
+
 from ..core.models import (
     CompanyInfo, FinancialStatement, IncomeStatement, BalanceSheet, CashFlowStatement
 )
@@ -48,15 +52,54 @@ YFINANCE_CASHFLOW_MAP = {
     "dividend_payments": "Cash Dividends Paid",
 }
 
+# Frozen (our_key, yf_key) pairs: the maps above are read-only after import,
+# so the extraction loops iterate these tuples instead of re-materializing
+# dict items views on every call.
+_YF_INCOME_ITEMS = tuple(YFINANCE_INCOME_MAP.items())
+_YF_BALANCE_ITEMS = tuple(YFINANCE_BALANCE_MAP.items())
+_YF_CASHFLOW_ITEMS = tuple(YFINANCE_CASHFLOW_MAP.items())
+
+
+def _records_by_period(df: "pd.DataFrame", key_map: Dict[str, str]) -> Dict[Any, Dict[str, Any]]:
+    """
+    Extracts all mapped rows from a statement DataFrame in one shot.
+
+    A single reindex selects every row we care about (missing ones become
+    NaN) using pandas' C-level fancy indexing, one bulk where() turns every
+    NaN into None, and to_dict yields {period_column: {yf_key: value}} so
+    the per-year loop below is pure dict access instead of hundreds of .loc
+    calls that each allocate a Series.
+    """
+    sub = df.reindex(index=list(key_map.values())).astype(object)
+    return sub.where(sub.notna(), None).to_dict()
+
 
 class YFinanceProvider(BaseDataProvider):
     """Provides financial data by fetching it from Yahoo Finance via the yfinance library."""
 
+    def __init__(self):
+        # yf.Ticker caches its fetched payloads per instance, so reusing one
+        # object per ticker is what collapses info + statements for the same
+        # company from 4-8 HTTP round trips down to 1-2.
+        self._ticker_cache: Dict[str, yf.Ticker] = {}
+
+    def _ticker(self, ticker: str) -> yf.Ticker:
+        """Returns a memoized yf.Ticker so repeat calls reuse its internal cache."""
+        # Deferred: yfinance drags in pandas and more (hundreds of ms, tens of
+        # MB) and a SEC-only run never needs it.
+        import yfinance as yf
+
+        ticker = ticker.upper()
+        ticker_obj = self._ticker_cache.get(ticker)
+        if ticker_obj is None:
+            ticker_obj = self._ticker_cache[ticker] = yf.Ticker(ticker)
+        return ticker_obj
+
     def get_company_info(self, ticker: str) -> CompanyInfo:
         """Fetches general company information for a given ticker."""
         logger.info(f"Getting company info for {ticker} from yfinance.")
         try:
-            ticker_obj = yf.Ticker(ticker)
+            ticker_obj = self._ticker(ticker)
             info = ticker_obj.info
             
             if not info or info.get('trailingPegRatio') is None: # A simple check for a valid ticker response
@@ -72,6 +115,9 @@ class YFinanceProvider(BaseDataProvider):
                 website=info.get('website'),
                 cik=None # yfinance does not provide CIK
             )
+        except DataProviderError:
+            # Already a meaningful provider error; don't rewrap and lose the message.
+            raise
         except Exception as e:
             logger.error(f"An unexpected error occurred while fetching info for '{ticker}' from yfinance: {e}")
             raise DataProviderError(f"Failed to get company info for '{ticker}' from yfinance.") from e
@@ -80,7 +126,7 @@ class YFinanceProvider(BaseDataProvider):
         """Fetches historical financial statements for a given ticker."""
         logger.info(f"Getting financial statements for {ticker} from yfinance.")
         try:
-            ticker_obj = yf.Ticker(ticker)
+            ticker_obj = self._ticker(ticker)
             
             # Fetch all statements. yfinance returns them as pandas DataFrames.
             income_stmt_df = ticker_obj.financials
@@ -92,21 +138,23 @@ class YFinanceProvider(BaseDataProvider):
 
             statements = []
             # Columns are datetime objects representing the period end date
+            income_records = _records_by_period(income_stmt_df, YFINANCE_INCOME_MAP)
+            balance_records = _records_by_period(balance_sheet_df, YFINANCE_BALANCE_MAP)
+            cash_flow_records = _records_by_period(cash_flow_df, YFINANCE_CASHFLOW_MAP)
+
+            def pick(records: Dict[Any, Dict[str, Any]], key_items, year_col) -> Dict[str, Optional[float]]:
+                """Maps one period's extracted row dict onto our model field names."""
+                # Missing values are already None thanks to the bulk NaN mask
+                # in _records_by_period, so no per-cell notna dispatch here.
+                row = records.get(year_col, {})
+                return {our_key: row.get(yf_key) for our_key, yf_key in key_items}
+
             for year_col in income_stmt_df.columns[:num_years]:
                 fy = year_col.year
-                
-                def get_val(df: pd.DataFrame, key_map: Dict, our_key: str) -> Optional[float]:
-                    """Safely gets a value from a DataFrame column for a given year."""
-                    yf_key = key_map.get(our_key)
-                    if not yf_key or yf_key not in df.index:
-                        return None
-                    
-                    val = df.loc[yf_key].get(year_col)
-                    return float(val) if pd.notna(val) else None
-
-                income_data = {key: get_val(income_stmt_df, YFINANCE_INCOME_MAP, key) for key in YFINANCE_INCOME_MAP}
-                balance_data = {key: get_val(balance_sheet_df, YFINANCE_BALANCE_MAP, key) for key in YFINANCE_BALANCE_MAP}
-                cash_flow_data = {key: get_val(cash_flow_df, YFINANCE_CASHFLOW_MAP, key) for key in YFINANCE_CASHFLOW_MAP}
+
+                income_data = pick(income_records, _YF_INCOME_ITEMS, year_col)
+                balance_data = pick(balance_records, _YF_BALANCE_ITEMS, year_col)
+                cash_flow_data = pick(cash_flow_records, _YF_CASHFLOW_ITEMS, year_col)
 
                 stmt = FinancialStatement(
                     ticker=ticker.upper(),
@@ -125,6 +173,8 @@ class YFinanceProvider(BaseDataProvider):
             
             return statements
 
+        except DataProviderError:
+            raise
         except Exception as e:
             logger.error(f"An unexpected error occurred while fetching statements for '{ticker}' from yfinance: {e}")
             raise DataProviderError(f"Failed to get financial statements for '{ticker}' from yfinance.") from e
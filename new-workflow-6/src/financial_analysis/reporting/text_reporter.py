@@ -1,6 +1,7 @@
 # File: src/financial_analysis/reporting/text_reporter.py
 # Purpose: Generates a comprehensive, human-readable text-based report.
 
+import io
 import logging
 import textwrap
 from .base_reporter import BaseReporter
@@ -8,6 +9,17 @@ from ..core.models import CompanyAnalysis
 
 logger = logging.getLogger(__name__)
 
+# Static report scaffolding, built once at import instead of re-assembled
+# from f-string pieces on every call.
+_HEADER_TEMPLATE = (
+    "FINANCIAL ANALYSIS REPORT\n"
+    + "=" * 25 + "\n"
+    "Company:         {name} ({ticker})\n"
+    "Sector:          {sector}\n"
+    "Industry:        {industry}\n"
+    "Analysis Date:   {date}"
+)
+
 class TextReporter(BaseReporter):
     """Generates a professional, formatted report in a .txt file."""
 
@@ -23,28 +35,35 @@ class TextReporter(BaseReporter):
 
     def _build_report_string(self, analysis: CompanyAnalysis) -> str:
         """Constructs the full report string from various formatted sections."""
-        sections = [
+        # Write sections into one growable buffer so the report is assembled
+        # with a single final allocation instead of intermediate concatenations.
+        buf = io.StringIO()
+        first = True
+        for section in (
             self._format_header(analysis),
             self._format_company_profile(analysis), # MODIFIED: Added company profile section
             self._format_summary(analysis),
             self._format_ratios_table(analysis),
             self._format_detailed_analysis(analysis),
             self._format_financial_statements(analysis),
-            self._format_disclaimer(analysis)
-        ]
-        # Filter out any empty sections before joining
-        return "\n\n".join(filter(None, sections))
+            self._format_disclaimer(analysis),
+        ):
+            if not section:  # Skip empty sections entirely
+                continue
+            if not first:
+                buf.write("\n\n")
+            buf.write(section)
+            first = False
+        return buf.getvalue()
 
     def _format_header(self, analysis: CompanyAnalysis) -> str:
         info = analysis.company_info
-        date_str = analysis.analysis_date.strftime('%Y-%m-%d %H:%M:%S UTC')
-        return (
-            f"FINANCIAL ANALYSIS REPORT\n"
-            f"{'=' * 25}\n"
-            f"Company:         {info.name} ({info.ticker})\n"
-            f"Sector:          {info.sector or 'N/A'}\n"
-            f"Industry:        {info.industry or 'N/A'}\n"
-            f"Analysis Date:   {date_str}"
+        return _HEADER_TEMPLATE.format(
+            name=info.name,
+            ticker=info.ticker,
+            sector=info.sector or 'N/A',
+            industry=info.industry or 'N/A',
+            date=analysis.analysis_date.strftime('%Y-%m-%d %H:%M:%S UTC'),
         )
 
     def _format_company_profile(self, analysis: CompanyAnalysis) -> str:
@@ -82,8 +101,8 @@ class TextReporter(BaseReporter):
         ratios = analysis.historical_ratios[:4] # Show up to 4 recent years
         years = [f"FY{r.fiscal_year}" for r in ratios]
         
-        lines = [f"{'Metric':<22}" + "".join([f"{y:>12}" for y in years])]
-        lines.append(f"{'-'*22}" + "".join([f"{'-'*12}" for y in years]))
+        lines = [f"{'Metric':<22}" + "".join(f"{y:>12}" for y in years)]
+        lines.append("-" * 22 + "-" * (12 * len(years)))
 
         ratio_keys = [
             ("Current Ratio", "current_ratio", ".2f"), ("Quick Ratio", "quick_ratio", ".2f"),
@@ -91,9 +110,13 @@ class TextReporter(BaseReporter):
             ("Debt-to-Equity", "debt_to_equity", ".2f")
         ]
         for name, key, fmt in ratio_keys:
-            values = [getattr(r, key, None) for r in ratios]
-            value_strs = [f"{v:{fmt}}" if v is not None else "N/A" for v in values]
-            lines.append(f"{name:<22}" + "".join([f"{s:>12}" for s in value_strs]))
+            # One pass per row: format and pad each value without staging an
+            # intermediate list of cell strings.
+            cells = "".join(
+                f"{v:>12{fmt}}" if v is not None else f"{'N/A':>12}"
+                for v in (getattr(r, key, None) for r in ratios)
+            )
+            lines.append(f"{name:<22}{cells}")
             
         return f"{header}\n" + "\n".join(lines)
 
@@ -2,117 +2,140 @@
 # Purpose: Generates qualitative analysis from quantitative ratio data.
 
 import logging
-from typing import List, Dict, Any, Optional
+from bisect import bisect_left, bisect_right
+from typing import List, Dict, Any
+
+import numpy as np
 
 from ..core.models import FinancialRatios
 
 logger = logging.getLogger(__name__)
 
+# Threshold tables for the qualitative verdicts: a bisect over the ascending
+# boundaries replaces each if/elif chain, and the matching sentences live in
+# tuples indexed by the result. bisect_right encodes >= boundaries,
+# bisect_left encodes <= boundaries.
+_CR_BOUNDS = (1.0, 1.5, 2.0)
+_CR_VERDICTS = (
+    "This is below 1.0, signaling potential risk in meeting short-term liabilities.",
+    "This indicates an adequate but potentially tight liquidity position.",
+    "This suggests a healthy liquidity position.",
+    "This indicates a very strong ability to meet short-term obligations.",
+)
+_NM_BOUNDS = (0.05, 0.15)  # the loss/profit boundary at zero is strict, handled separately
+_NM_VERDICTS = (
+    "The company is operating at a net loss, which is a significant concern.",
+    "Profitability is positive but margins are thin, suggesting competitive pressure or high costs.",
+    "This reflects solid profitability.",
+    "This indicates excellent profitability and strong operational efficiency.",
+)
+_DE_BOUNDS = (0.4, 1.0, 2.0)
+_DE_VERDICTS = (
+    "This indicates a conservative and strong balance sheet with low reliance on debt.",
+    "This suggests a moderate and generally acceptable level of debt.",
+    "This indicates an elevated level of debt, increasing financial risk.",
+    "This represents a high level of debt, which may pose significant financial risk.",
+)
+_AT_BOUNDS = (0.5, 1.0)
+_AT_VERDICTS = (
+    "A low ratio may indicate underutilization of assets or an asset-heavy business model.",
+    "This suggests a moderate level of asset efficiency.",
+    "A ratio above 1.0 suggests efficient use of assets.",
+)
+
 class AnalysisService:
     """
     Generates qualitative, data-driven analysis from historical financial ratios.
     This service translates quantitative data into objective, human-readable insights.
     """
 
-    def _get_trend(self, data: List[Optional[float]]) -> str:
-        """Determines the trend from a list of historical data points."""
-        # Filter out None values for trend calculation
-        valid_data = [d for d in data if d is not None]
-        if len(valid_data) < 2:
-            return "stable (insufficient data)"
-        
-        if valid_data[0] > valid_data[-1]:
+    __slots__ = ()  # stateless; skip the per-instance __dict__
+
+    # Metrics whose histories drive the trend wording, one array slot each.
+    _TREND_ATTRS = ("current_ratio", "net_margin", "debt_to_equity", "asset_turnover")
+
+    def _extract_series(self, ratios: List[FinancialRatios], attrs) -> Dict[str, np.ndarray]:
+        """Packs metric histories into NaN-padded arrays in one pass over ratios."""
+        arrays = {attr: np.full(len(ratios), np.nan, dtype=np.float64) for attr in attrs}
+        for idx, r in enumerate(ratios):
+            for attr, arr in arrays.items():
+                value = getattr(r, attr)
+                if value is not None:
+                    arr[idx] = value
+        return arrays
+
+    def _get_trend(self, series: np.ndarray) -> str:
+        """Determines the trend from a NaN-padded history array."""
+        # Only the endpoints matter. In the common case both ends hold data
+        # and no mask or compressed copy is needed at all; otherwise fall
+        # back to locating the first and last valid slots.
+        if series.size >= 2 and not (np.isnan(series[0]) or np.isnan(series[-1])):
+            first, last = series[0], series[-1]
+        else:
+            valid_idx = np.flatnonzero(~np.isnan(series))
+            if valid_idx.size < 2:
+                return "stable (insufficient data)"
+            first, last = series[valid_idx[0]], series[valid_idx[-1]]
+
+        if first > last:
             return "improving"
-        elif valid_data[0] < valid_data[-1]:
+        elif first < last:
             return "declining"
         else:
             return "stable"
 
-    def _analyze_liquidity(self, ratios: List[FinancialRatios]) -> str:
+    def _analyze_liquidity(self, ratios: List[FinancialRatios], series: np.ndarray) -> str:
         """Analyzes liquidity position."""
-        latest = ratios[0]
-        if latest.current_ratio is None:
+        current_ratio = ratios[0].current_ratio
+        if current_ratio is None:
             return "Liquidity data is not available."
 
-        historical_cr = [r.current_ratio for r in ratios]
-        trend = self._get_trend(historical_cr)
+        trend = self._get_trend(series)
         
-        text = f"The most recent Current Ratio is {latest.current_ratio:.2f}, showing a {trend} trend. "
-        
-        if latest.current_ratio >= 2.0:
-            text += "This indicates a very strong ability to meet short-term obligations."
-        elif latest.current_ratio >= 1.5:
-            text += "This suggests a healthy liquidity position."
-        elif latest.current_ratio >= 1.0:
-            text += "This indicates an adequate but potentially tight liquidity position."
-        else:
-            text += "This is below 1.0, signaling potential risk in meeting short-term liabilities."
-        return text
+        text = f"The most recent Current Ratio is {current_ratio:.2f}, showing a {trend} trend. "
+        return text + _CR_VERDICTS[bisect_right(_CR_BOUNDS, current_ratio)]
 
-    def _analyze_profitability(self, ratios: List[FinancialRatios]) -> str:
+    def _analyze_profitability(self, ratios: List[FinancialRatios], series: np.ndarray) -> str:
         """Analyzes profitability metrics."""
         latest = ratios[0]
-        if latest.net_margin is None or latest.roe is None:
+        net_margin = latest.net_margin
+        if net_margin is None or latest.roe is None:
             return "Profitability data is not available."
             
-        historical_nm = [r.net_margin for r in ratios]
-        trend = self._get_trend(historical_nm)
+        trend = self._get_trend(series)
 
-        text = (f"The company's latest Net Profit Margin is {latest.net_margin:.2%}, "
+        text = (f"The company's latest Net Profit Margin is {net_margin:.2%}, "
                 f"with a {trend} trend over the analyzed period. "
                 f"Return on Equity (ROE) stands at {latest.roe:.2%}. ")
 
-        if latest.net_margin >= 0.15:
-            text += "This indicates excellent profitability and strong operational efficiency."
-        elif latest.net_margin >= 0.05:
-            text += "This reflects solid profitability."
-        elif latest.net_margin > 0:
-            text += "Profitability is positive but margins are thin, suggesting competitive pressure or high costs."
-        else:
-            text += "The company is operating at a net loss, which is a significant concern."
-        return text
+        idx = 0 if net_margin <= 0 else bisect_right(_NM_BOUNDS, net_margin) + 1
+        return text + _NM_VERDICTS[idx]
 
-    def _analyze_leverage(self, ratios: List[FinancialRatios]) -> str:
+    def _analyze_leverage(self, ratios: List[FinancialRatios], series: np.ndarray) -> str:
         """Analyzes debt and leverage position."""
-        latest = ratios[0]
-        if latest.debt_to_equity is None:
+        debt_to_equity = ratios[0].debt_to_equity
+        if debt_to_equity is None:
             return "Leverage data is not available."
 
-        historical_de = [r.debt_to_equity for r in ratios]
-        trend = self._get_trend(historical_de) # Note: For D/E, "improving" means it's going down.
+        trend = self._get_trend(series) # Note: For D/E, "improving" means it's going down.
         
-        text = (f"The Debt-to-Equity ratio is {latest.debt_to_equity:.2f}. "
+        text = (f"The Debt-to-Equity ratio is {debt_to_equity:.2f}. "
                 f"The trend is {trend}, where a declining number is generally favorable. ")
                 
-        if latest.debt_to_equity <= 0.4:
-            text += "This indicates a conservative and strong balance sheet with low reliance on debt."
-        elif latest.debt_to_equity <= 1.0:
-            text += "This suggests a moderate and generally acceptable level of debt."
-        elif latest.debt_to_equity <= 2.0:
-            text += "This indicates an elevated level of debt, increasing financial risk."
-        else:
-            text += "This represents a high level of debt, which may pose significant financial risk."
-        return text
+        return text + _DE_VERDICTS[bisect_left(_DE_BOUNDS, debt_to_equity)]
         
-    def _analyze_efficiency(self, ratios: List[FinancialRatios]) -> str:
+    def _analyze_efficiency(self, ratios: List[FinancialRatios], series: np.ndarray) -> str:
         """Analyzes operational efficiency."""
-        latest = ratios[0]
-        if latest.asset_turnover is None:
+        asset_turnover = ratios[0].asset_turnover
+        if asset_turnover is None:
             return "Efficiency data is not available."
             
-        historical_at = [r.asset_turnover for r in ratios]
-        trend = self._get_trend(historical_at)
+        trend = self._get_trend(series)
 
-        text = (f"Asset Turnover ratio is {latest.asset_turnover:.2f}, with a {trend} trend. "
+        text = (f"Asset Turnover ratio is {asset_turnover:.2f}, with a {trend} trend. "
                 "This ratio measures how efficiently the company uses its assets to generate revenue. ")
                 
-        if latest.asset_turnover >= 1.0:
-            text += "A ratio above 1.0 suggests efficient use of assets."
-        elif latest.asset_turnover >= 0.5:
-            text += "This suggests a moderate level of asset efficiency."
-        else:
-            text += "A low ratio may indicate underutilization of assets or an asset-heavy business model."
-        return text
+        return text + _AT_VERDICTS[bisect_right(_AT_BOUNDS, asset_turnover)]
     
     def _synthesize_findings(self, analysis: Dict[str, str], ratios: List[FinancialRatios]) -> Dict[str, Any]:
         """Creates a high-level summary of strengths and weaknesses."""
@@ -120,26 +143,40 @@ class AnalysisService:
         strengths = []
         concerns = []
 
+        # Bind the section texts and metric values once up front. The explicit
+        # None checks also fix a subtle bug: a metric of exactly 0.0 was
+        # falsy and silently skipped classification (a zero net margin or
+        # zero leverage is meaningful data, not missing data).
+        liquidity_text = analysis.get('liquidity', '')
+        profitability_text = analysis.get('profitability', '')
+        leverage_text = analysis.get('leverage', '')
+        current_ratio = latest.current_ratio
+        net_margin = latest.net_margin
+        debt_to_equity = latest.debt_to_equity
+
         # Liquidity
-        if latest.current_ratio and latest.current_ratio >= 1.5:
-            strengths.append(f"Strong liquidity ({analysis.get('liquidity', '')})")
-        elif latest.current_ratio and latest.current_ratio < 1.0:
-            concerns.append(f"Potential liquidity risk ({analysis.get('liquidity', '')})")
+        if current_ratio is not None:
+            if current_ratio >= 1.5:
+                strengths.append(f"Strong liquidity ({liquidity_text})")
+            elif current_ratio < 1.0:
+                concerns.append(f"Potential liquidity risk ({liquidity_text})")
 
         # Profitability
-        if latest.net_margin and latest.net_margin >= 0.10:
-            strengths.append(f"High profitability ({analysis.get('profitability', '')})")
-        elif latest.net_margin and latest.net_margin < 0:
-            concerns.append(f"Operating at a net loss ({analysis.get('profitability', '')})")
+        if net_margin is not None:
+            if net_margin >= 0.10:
+                strengths.append(f"High profitability ({profitability_text})")
+            elif net_margin < 0:
+                concerns.append(f"Operating at a net loss ({profitability_text})")
 
         # Leverage
-        if latest.debt_to_equity and latest.debt_to_equity <= 0.5:
-            strengths.append(f"Low financial leverage ({analysis.get('leverage', '')})")
-        elif latest.debt_to_equity and latest.debt_to_equity > 1.5:
-            concerns.append(f"High debt levels ({analysis.get('leverage', '')})")
+        if debt_to_equity is not None:
+            if debt_to_equity <= 0.5:
+                strengths.append(f"Low financial leverage ({leverage_text})")
+            elif debt_to_equity > 1.5:
+                concerns.append(f"High debt levels ({leverage_text})")
 
         overall = "The company presents a mixed financial profile."
-        if len(strengths) > len(concerns) and not concerns:
+        if strengths and not concerns:
             overall = "The company demonstrates a strong overall financial position based on the available data."
         elif len(concerns) > len(strengths):
             overall = "The analysis highlights several areas of concern that warrant attention."
@@ -166,11 +203,15 @@ class AnalysisService:
 
         logger.info(f"Generating qualitative analysis for {historical_ratios[0].ticker}.")
 
+        # One pass over the ratios fills every metric history, instead of each
+        # _analyze_* method re-walking the list for its own comprehension.
+        series = self._extract_series(historical_ratios, self._TREND_ATTRS)
+
         analysis = {
-            "liquidity": self._analyze_liquidity(historical_ratios),
-            "profitability": self._analyze_profitability(historical_ratios),
-            "leverage": self._analyze_leverage(historical_ratios),
-            "efficiency": self._analyze_efficiency(historical_ratios),
+            "liquidity": self._analyze_liquidity(historical_ratios, series["current_ratio"]),
+            "profitability": self._analyze_profitability(historical_ratios, series["net_margin"]),
+            "leverage": self._analyze_leverage(historical_ratios, series["debt_to_equity"]),
+            "efficiency": self._analyze_efficiency(historical_ratios, series["asset_turnover"]),
         }
         
         synthesis = self._synthesize_findings(analysis, historical_ratios)
@@ -2,6 +2,7 @@
 # Purpose: Orchestrates one or more data providers to fetch and enrich financial data. (Updated)
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Tuple, Optional
 
 from ..data_providers.base_provider import BaseDataProvider, DataProviderError
@@ -15,6 +16,8 @@ class DataService:
     more data providers. It implements a fallback and data enrichment strategy.
     """
 
+    __slots__ = ('providers',)
+
     def __init__(self, providers: List[BaseDataProvider]):
         """
         Initializes the DataService with a list of data providers.
@@ -52,24 +55,46 @@ class DataService:
         company_info: Optional[CompanyInfo] = None
         statements: List[FinancialStatement] = []
         last_statement_error: Optional[Exception] = None
+        primary_provider: Optional[BaseDataProvider] = None
+        # Request-scoped memo: info fetched during the statement attempts is
+        # reused by the enrichment pass instead of re-fetched over HTTP.
+        info_cache: dict = {}
 
-        # --- Step 1: Fetch financial statements from the first available provider ---
-        for provider in self.providers:
-            provider_name = provider.__class__.__name__
-            logger.info(f"Attempting to fetch STATEMENTS for '{ticker}' using {provider_name}.")
-            try:
-                # Get the base company info and statements from this provider
-                company_info = provider.get_company_info(ticker)
-                statements = provider.get_financial_statements(ticker, num_years)
-                
-                logger.info(f"Successfully fetched primary statements for '{ticker}' using {provider_name}.")
-                break  # Exit loop on first success
-                
-            except DataProviderError as e:
-                logger.warning(f"Could not fetch statements from {provider_name}: {e}")
-                last_statement_error = e
-                company_info = None # Reset info if statements failed
-                continue
+        # --- Step 1: Fetch financial statements, racing all providers ---
+        # Every provider's fetch starts immediately, but results are consumed
+        # strictly in priority order, so the chosen source is identical to the
+        # old sequential walk. The difference is latency on the failure path:
+        # when the primary errors out or times out, the fallback's response is
+        # already in flight instead of starting from zero.
+        def attempt_statements(provider: BaseDataProvider):
+            company_info = provider.get_company_info(ticker)
+            info_cache[id(provider)] = company_info
+            return company_info, provider.get_financial_statements(ticker, num_years)
+
+        # Deliberately not a 'with' block: the context manager joins every
+        # worker on exit, which would gate the happy path on the slowest
+        # speculative fallback instead of on the winning provider.
+        pool = ThreadPoolExecutor(max_workers=len(self.providers))
+        try:
+            futures = [pool.submit(attempt_statements, provider) for provider in self.providers]
+            for provider, future in zip(self.providers, futures):
+                provider_name = provider.__class__.__name__
+                logger.info(f"Attempting to fetch STATEMENTS for '{ticker}' using {provider_name}.")
+                try:
+                    company_info, statements = future.result()
+                    logger.info(f"Successfully fetched primary statements for '{ticker}' using {provider_name}.")
+                    primary_provider = provider
+                    break  # First provider (in priority order) to succeed wins
+                except DataProviderError as e:
+                    logger.warning(f"Could not fetch statements from {provider_name}: {e}")
+                    last_statement_error = e
+                    company_info = None # Reset info if statements failed
+        finally:
+            # Speculative attempts that never got a worker are dropped; ones
+            # already running finish in the background and are simply ignored.
+            for future in futures:
+                future.cancel()
+            pool.shutdown(wait=False)
         
         if not statements or not company_info:
             logger.error(f"All providers failed to return financial statements for '{ticker}'.")
@@ -79,25 +104,50 @@ class DataService:
         # The company_info from the successful statement provider is our base.
         merged_info_dict = company_info.model_dump()
 
-        for provider in self.providers:
-            provider_name = provider.__class__.__name__
-            try:
-                logger.info(f"Attempting to ENRICH company info for '{ticker}' using {provider_name}.")
-                enrichment_info = provider.get_company_info(ticker)
-                
-                # Iterate through the fields of the enrichment data
-                for key, value in enrichment_info.model_dump().items():
-                    # If our base data is missing this field and the enrichment one has it, add it.
-                    if merged_info_dict.get(key) is None and value is not None:
-                        logger.debug(f"Enriching '{key}' with value from {provider_name}.")
-                        merged_info_dict[key] = value
+        # Each get_company_info is a blocking HTTP call, so the fan-out runs on
+        # a thread pool: total enrichment latency is the slowest provider, not
+        # the sum. Results are merged serially below, in provider-priority
+        # order, so no locking is needed and the merge stays deterministic.
+        enrichment_providers = [p for p in self.providers if p is not primary_provider]
+        enrichment_results: List[Optional[CompanyInfo]] = []
+        if enrichment_providers:
+            def fetch_info(provider: BaseDataProvider) -> Optional[CompanyInfo]:
+                cached = info_cache.get(id(provider))
+                if cached is not None:
+                    return cached
+                provider_name = provider.__class__.__name__
+                try:
+                    logger.info(f"Attempting to ENRICH company info for '{ticker}' using {provider_name}.")
+                    return provider.get_company_info(ticker)
+                except DataProviderError as e:
+                    logger.warning(f"Could not fetch enrichment info from {provider_name}, skipping. Error: {e}")
+                    return None
+
+            with ThreadPoolExecutor(max_workers=len(enrichment_providers)) as pool:
+                enrichment_results = list(pool.map(fetch_info, enrichment_providers))
 
-            except DataProviderError as e:
-                logger.warning(f"Could not fetch enrichment info from {provider_name}, skipping. Error: {e}")
+        for provider, enrichment_info in zip(enrichment_providers, enrichment_results):
+            if enrichment_info is None:
                 continue
+            provider_name = provider.__class__.__name__
+            # Only look at the intersection of what we still need and what
+            # this provider explicitly set: sparse providers contribute a few
+            # fields, so the inner loop shrinks to those instead of walking
+            # the full field list (and no model_dump() dict is built at all).
+            missing = {key for key in CompanyInfo.model_fields if merged_info_dict.get(key) is None}
+            if not missing:
+                break
+            for key in enrichment_info.model_fields_set & missing:
+                value = getattr(enrichment_info, key)
+                if value is not None:
+                    # Deferred formatting: this fires per field per provider.
+                    logger.debug("Enriching '%s' with value from %s.", key, provider_name)
+                    merged_info_dict[key] = value
         
-        # Create the final, enriched CompanyInfo object
-        final_company_info = CompanyInfo(**merged_info_dict)
+        # Create the final, enriched CompanyInfo object. Every field came out
+        # of an already-validated CompanyInfo, so model_construct skips a
+        # redundant full validation pass.
+        final_company_info = CompanyInfo.model_construct(**merged_info_dict)
         
         logger.info(f"Completed data fetching and enrichment for '{ticker}'.")
         return final_company_info, statements
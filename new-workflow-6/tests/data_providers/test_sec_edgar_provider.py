@@ -0,0 +1,47 @@
+# File: tests/data_providers/test_sec_edgar_provider.py
+# Purpose: Unit tests for the SEC EDGAR provider's cache helpers.
+
+from datetime import datetime
+
+from financial_analysis.data_providers.sec_edgar_provider import (
+    _load_cached_annual,
+    _store_cached_annual,
+)
+
+
+class FakeRedis:
+    """Minimal stand-in for the Redis client: just setex/get over a dict."""
+
+    def __init__(self):
+        self._store = {}
+
+    def setex(self, key, ttl, value):
+        self._store[key] = value
+
+    def get(self, key):
+        return self._store.get(key)
+
+
+def test_store_and_load_cached_annual_round_trip():
+    """The aggregated annual cache must survive serialization intact,
+    including its int fiscal-year keys (orjson stringifies them on the way
+    out and the loader converts them back)."""
+    annual_data = {
+        2023: {"revenue": 100.0, "net_income": 20.0},
+        2022: {"revenue": 90.0},
+    }
+    end_dates = {2023: datetime(2023, 9, 30), 2022: datetime(2022, 9, 24)}
+    client = FakeRedis()
+
+    _store_cached_annual(client, "0000320193", annual_data, end_dates)
+    cached = _load_cached_annual(client, "0000320193")
+
+    assert cached is not None
+    loaded_annual, loaded_end_dates = cached
+    assert loaded_annual == annual_data
+    assert loaded_end_dates == end_dates
+
+
+def test_load_cached_annual_handles_misses():
+    assert _load_cached_annual(FakeRedis(), "0000320193") is None
+    assert _load_cached_annual(None, "0000320193") is None
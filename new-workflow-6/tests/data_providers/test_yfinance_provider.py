@@ -10,45 +10,50 @@ from financial_analysis.data_providers.yfinance_provider import YFinanceProvider
 from financial_analysis.data_providers.base_provider import DataProviderError
 from financial_analysis.core.models import CompanyInfo, FinancialStatement
 
+# Mock data that mimics the real yfinance output. Built once at module scope:
+# DataFrame construction (dtype inference, index building) is by far the most
+# expensive part of this fixture, and the tests never mutate these frames in
+# place — they only swap attributes on their per-test mock.
+_MOCK_INFO = {
+    'longName': 'MockTech Inc.',
+    'exchange': 'MOCK',
+    'sector': 'Technology',
+    'industry': 'Software - Infrastructure',
+    'longBusinessSummary': 'MockTech Inc. provides mock software solutions.',
+    'website': 'http://mocktech.com',
+    'trailingPegRatio': 1.5 # Used as a key to check for valid data
+}
+
+_DATE_COLS = [datetime(2023, 12, 31), datetime(2022, 12, 31)]
+
+_MOCK_FINANCIALS = pd.DataFrame({
+    'Total Revenue': [1000, 900],
+    'Gross Profit': [800, 700],
+    'Net Income': [200, 150]
+}, index=_DATE_COLS).T
+
+_MOCK_BALANCE_SHEET = pd.DataFrame({
+    'Total Assets': [5000, 4500],
+    'Current Assets': [2000, 1800],
+    'Total Debt': [1000, 950]
+}, index=_DATE_COLS).T
+
+_MOCK_CASHFLOW = pd.DataFrame({
+    'Operating Cash Flow': [500, 450],
+    'Capital Expenditure': [100, 90]
+}, index=_DATE_COLS).T
+
+
 @pytest.fixture
 def mock_yf_ticker():
     """A pytest fixture to mock the yfinance.Ticker object."""
-    # Mock data that mimics the real yfinance output
-    mock_info = {
-        'longName': 'MockTech Inc.',
-        'exchange': 'MOCK',
-        'sector': 'Technology',
-        'industry': 'Software - Infrastructure',
-        'longBusinessSummary': 'MockTech Inc. provides mock software solutions.',
-        'website': 'http://mocktech.com',
-        'trailingPegRatio': 1.5 # Used as a key to check for valid data
-    }
-    
-    date_cols = [datetime(2023, 12, 31), datetime(2022, 12, 31)]
-    
-    mock_financials = pd.DataFrame({
-        'Total Revenue': [1000, 900],
-        'Gross Profit': [800, 700],
-        'Net Income': [200, 150]
-    }, index=date_cols).T
-    
-    mock_balance_sheet = pd.DataFrame({
-        'Total Assets': [5000, 4500],
-        'Current Assets': [2000, 1800],
-        'Total Debt': [1000, 950]
-    }, index=date_cols).T
-    
-    mock_cashflow = pd.DataFrame({
-        'Operating Cash Flow': [500, 450],
-        'Capital Expenditure': [100, 90]
-    }, index=date_cols).T
-
-    # Create a mock object that has the 'info' attribute and methods
+    # A fresh mock per test (so attribute swaps don't leak between tests)
+    # wired to the shared module-level frames.
     mock_ticker_instance = MagicMock()
-    mock_ticker_instance.info = mock_info
-    mock_ticker_instance.financials = mock_financials
-    mock_ticker_instance.balance_sheet = mock_balance_sheet
-    mock_ticker_instance.cashflow = mock_cash_flow
+    mock_ticker_instance.info = dict(_MOCK_INFO)
+    mock_ticker_instance.financials = _MOCK_FINANCIALS
+    mock_ticker_instance.balance_sheet = _MOCK_BALANCE_SHEET
+    mock_ticker_instance.cashflow = _MOCK_CASHFLOW
     
     # Use patch to replace yfinance.Ticker with our mock
     with patch('yfinance.Ticker', return_value=mock_ticker_instance) as mock:
@@ -1,4 +1,5 @@
 # File: src/analysis.py
+from data_extractor import pivot_metrics
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -14,14 +15,13 @@ class FinancialAnalyzer:
             "benchmarks": {},
             "peers": [],
             "risks": [],
-            "data_quality": "High" if all(v is not None for v in ratios.values()) else "Medium",
+            "data_quality": "High" if None not in ratios.values() else "Medium",
         }
-        # Example trend: last 2 years for revenue
-        if "Revenue" in fin_data and len(fin_data["Revenue"]) > 1:
-            this = fin_data["Revenue"].iloc[0]["value"]
-            last = fin_data["Revenue"].iloc[1]["value"]
-            growth = (this - last) / last if last else None
-            analysis["trends"]["Revenue Growth"] = growth
+        # YoY growth for every metric in one vectorized pass
+        piv = pivot_metrics(fin_data)
+        if len(piv) > 1:
+            growth = piv.sort_index().pct_change().iloc[-1]
+            analysis["trends"] = {f"{metric} Growth": value for metric, value in growth.dropna().items()}
         # TODO: Add benchmarking/peer analysis as needed
         logger.info("Analysis composed")
         return analysis
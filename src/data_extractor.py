@@ -1,18 +1,31 @@
 # File: src/data_extractor.py
+import numpy as np
 import pandas as pd
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+def _empty_frame():
+    return pd.DataFrame(columns=['metric', 'fiscal_year', 'end_date', 'value', 'unit'])
+
+def pivot_metrics(fin_data):
+    """Pivot the tidy metric frame into a fiscal_year x metric value table."""
+    if fin_data.empty:
+        return pd.DataFrame()
+    return fin_data.pivot_table(
+        index='fiscal_year', columns='metric', values='value', aggfunc='first'
+    ).sort_index()
+
 class DataExtractor:
     async def extract_all_statements(self, filings, years=5):
         """
         Extract key financial items from SEC XBRL filings.
-        Returns standardized dict of Income, Balance Sheet, Cash Flow.
+        Returns one tidy DataFrame with columns
+        [metric, fiscal_year, end_date, value, unit] covering all statements.
         """
         if not filings or "facts" not in filings:
-            logger.warning("No filings to extract, returning empty dict.")
-            return {}
+            logger.warning("No filings to extract, returning empty frame.")
+            return _empty_frame()
         us_gaap = filings["facts"].get("us-gaap", {})
         # Key line items mapping
         key_items = {
@@ -28,7 +41,7 @@ class DataExtractor:
             'Cash': ['CashAndCashEquivalentsAtCarryingValue'],
             'OperatingCashFlow': ['NetCashProvidedByUsedInOperatingActivities']
         }
-        statements = {}
+        metric_frames = []
         for std_name, sec_keys in key_items.items():
             found = None
             for k in sec_keys:
@@ -36,19 +49,45 @@ class DataExtractor:
                     found = us_gaap[k]
                     break
             if found:
-                data = []
-                for unit, vals in found.get("units", {}).items():
-                    for v in vals:
-                        if v.get("form") == "10-K" and 'fy' in v:
-                            data.append({
-                                "fiscal_year": v["fy"],
-                                "end_date": v["end"],
-                                "value": v["val"],
-                                "unit": unit
-                            })
-                if data:
-                    df = pd.DataFrame(data)
-                    df = df.sort_values('end_date', ascending=False).head(years)
-                    statements[std_name] = df
-                    logger.info(f"Extracted {std_name}: {len(df)} years")
-        return statements
+                # Mega-cap tags can carry >100k facts; one flat C-level
+                # comprehension across every unit drops everything but annual
+                # 10-K rows before any frame is built, so pandas only ever
+                # sees the handful of rows that survive.
+                rows = [
+                    (unit, v['fy'], v['end'], v['val'])
+                    for unit, vals in found.get("units", {}).items()
+                    for v in vals
+                    if v.get("form") == "10-K" and v.get("fy") is not None
+                ]
+                if rows:
+                    # Fill preallocated typed arrays and hand them to pandas
+                    # directly; a list-of-dicts would make pandas re-copy every
+                    # row into columnar storage with per-cell type inference.
+                    n = len(rows)
+                    units = np.empty(n, object)
+                    fys = np.empty(n, np.int32)
+                    ends = np.empty(n, 'datetime64[D]')
+                    values = np.empty(n, np.float64)
+                    for i, (unit, fy, end, val) in enumerate(rows):
+                        units[i] = unit
+                        fys[i] = fy
+                        ends[i] = end
+                        values[i] = val
+                    df = pd.DataFrame(
+                        {'fiscal_year': fys, 'end_date': ends, 'value': values, 'unit': units},
+                        copy=False,
+                    )
+                    # O(n log k) partial sort: only the newest `years` rows matter.
+                    df = df.nlargest(years, 'end_date')
+                    df.insert(0, 'metric', std_name)
+                    metric_frames.append(df)
+                    logger.info("Extracted %s: %d years", std_name, len(df))
+        if not metric_frames:
+            return _empty_frame()
+        tidy = pd.concat(metric_frames, copy=False, ignore_index=True)
+        # metric and unit draw from tiny vocabularies ("USD", "Revenue", ...);
+        # categorical storage keeps int8 codes instead of repeated str objects
+        # and turns equality masks into integer compares.
+        tidy['metric'] = tidy['metric'].astype('category')
+        tidy['unit'] = tidy['unit'].astype('category')
+        return tidy
@@ -1,12 +1,37 @@
 # File: src/data_retriever.py
 import aiohttp
-import yfinance as yf
 import asyncio
-from utils.logger import get_logger
+import orjson
 import time
+from email.utils import formatdate
+from pathlib import Path
+from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# On-disk cache for SEC payloads: the ticker map (~10MB) changes rarely and
+# companyfacts supports conditional GET, so repeat runs skip the downloads.
+CACHE_DIR = Path.home() / ".cache" / "finanalyzer"
+TICKER_MAP_MAX_AGE = 24 * 3600  # seconds
+
+# Market data barely moves minute to minute; cache yfinance lookups briefly
+# so batch runs and repeated calls don't refetch the same ticker.
+MARKET_DATA_TTL = 15 * 60  # seconds
+_yf_info_cache = {}
+
+def _get_yf_info(ticker):
+    # Deferred so importing this module doesn't pay yfinance's heavy
+    # import chain (pandas etc.) on runs that never touch market data.
+    import yfinance as yf
+
+    key = ticker.upper()
+    cached = _yf_info_cache.get(key)
+    if cached is not None and time.time() - cached[0] < MARKET_DATA_TTL:
+        return cached[1]
+    info = yf.Ticker(ticker).info
+    _yf_info_cache[key] = (time.time(), info)
+    return info
+
 class DataRetriever:
     SEC_TICKER_MAP_URL = "https://www.sec.gov/files/company_tickers.json"
     SEC_CIK_API = "https://data.sec.gov/submissions/CIK{cik}.json"
@@ -14,35 +39,69 @@ class DataRetriever:
 
     HEADERS = {"User-Agent": "Financial Analyzer 1.0 (your-email@company.com)"}
 
+    def __init__(self):
+        self._session = None
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        self._ticker_map_file = CACHE_DIR / "tickers.json"
+        self._ticker_map = None
+        if self._ticker_map_file.exists() and time.time() - self._ticker_map_file.stat().st_mtime < TICKER_MAP_MAX_AGE:
+            self._ticker_map = orjson.loads(self._ticker_map_file.read_bytes())
+            logger.info("Loaded ticker map for %d tickers from disk cache", len(self._ticker_map))
+
+    async def __aenter__(self):
+        # One pooled, keep-alive session for the retriever's lifetime: repeat
+        # SEC calls reuse the warm connection instead of paying TLS per request.
+        self._session = aiohttp.ClientSession(
+            headers=self.HEADERS,
+            connector=aiohttp.TCPConnector(limit=8, ttl_dns_cache=300),
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self._session.close()
+        self._session = None
+
     async def get_cik_and_name(self, ticker):
-        # Get CIK and company name for ticker
-        async with aiohttp.ClientSession(headers=self.HEADERS) as session:
-            async with session.get(self.SEC_TICKER_MAP_URL) as resp:
-                data = await resp.json()
-                for info in data.values():
-                    if info["ticker"].lower() == ticker.lower():
-                        cik = str(info["cik_str"])
-                        name = info["title"]
-                        logger.info(f"Found CIK {cik} for {ticker}: {name}")
-                        return cik, name
-        raise Exception(f"CIK not found for ticker {ticker}")
+        # Get CIK and company name for ticker via an O(1) lookup on the cached map
+        if self._ticker_map is None:
+            async with self._session.get(self.SEC_TICKER_MAP_URL) as resp:
+                data = orjson.loads(await resp.read())
+            self._ticker_map = {
+                info["ticker"].lower(): (str(info["cik_str"]), info["title"])
+                for info in data.values()
+            }
+            self._ticker_map_file.write_bytes(orjson.dumps(self._ticker_map))
+            logger.info("Built ticker map for %d tickers", len(self._ticker_map))
+        try:
+            cik, name = self._ticker_map[ticker.lower()]
+        except KeyError:
+            raise Exception(f"CIK not found for ticker {ticker}")
+        logger.info("Found CIK %s for %s: %s", cik, ticker, name)
+        return cik, name
 
     async def get_financial_filings(self, cik):
-        # Download latest company facts (XBRL) from SEC
+        # Download latest company facts (XBRL) from SEC, revalidating the disk copy
         padded = cik.zfill(10)
         url = self.SEC_FILINGS_API.format(cik_padded=padded)
-        async with aiohttp.ClientSession(headers=self.HEADERS) as session:
-            async with session.get(url) as resp:
-                if resp.status == 200:
-                    logger.info(f"SEC filings retrieved for CIK {cik}")
-                    return await resp.json()
-                else:
-                    logger.warning("SEC filings not found, falling back to Yahoo Finance scraping")
-                    return None
+        cache_file = CACHE_DIR / f"companyfacts_CIK{padded}.json"
+        headers = {}
+        if cache_file.exists():
+            headers["If-Modified-Since"] = formatdate(cache_file.stat().st_mtime, usegmt=True)
+        async with self._session.get(url, headers=headers) as resp:
+            if resp.status == 304:
+                logger.info("SEC filings for CIK %s unchanged, using disk cache", cik)
+                return orjson.loads(cache_file.read_bytes())
+            if resp.status == 200:
+                raw = await resp.read()
+                cache_file.write_bytes(raw)
+                logger.info("SEC filings retrieved for CIK %s", cik)
+                return orjson.loads(raw)
+            logger.warning("SEC filings not found, falling back to Yahoo Finance scraping")
+            return None
 
     async def get_market_data(self, ticker):
-        # Use yfinance for market data
-        stock = yf.Ticker(ticker)
-        info = stock.info
-        logger.info(f"Fetched market data for {ticker}")
+        # yfinance is blocking; run it on a worker thread so the event loop
+        # stays free to drive the SEC download at the same time.
+        info = await asyncio.to_thread(_get_yf_info, ticker)
+        logger.info("Fetched market data for %s", ticker)
         return info
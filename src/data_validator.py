@@ -6,12 +6,13 @@ logger = get_logger(__name__)
 class DataValidator:
     def validate_data(self, fin_data, market_data):
         # Check for presence and balance sheet integrity, flag missing data
-        validated = {}
-        for k, df in fin_data.items():
-            if df is not None and not df.empty:
-                validated[k] = df
-            else:
-                logger.warning(f"Missing or empty data for {k}")
+        if fin_data.empty:
+            logger.warning("No financial data extracted")
+            return fin_data
+        validated = fin_data[fin_data['value'].notna()]
+        dropped = set(fin_data['metric'].unique()) - set(validated['metric'].unique())
+        for metric in dropped:
+            logger.warning("Missing or empty data for %s", metric)
         # Optionally add confidence levels, outlier detection, etc.
         # For demo: everything present = High confidence, else Medium/Low
         return validated
@@ -4,18 +4,65 @@ import asyncio
 import sys
 from pathlib import Path
 from utils.logger import setup_logging, get_logger
-from data_retriever import DataRetriever
-from data_extractor import DataExtractor
-from data_validator import DataValidator
-from ratio_calculator import RatioCalculator
-from analysis import FinancialAnalyzer
-from report_generator import ReportGenerator
+
+# NOTE: pipeline imports are deferred into the functions below so that
+# `--help` and argument errors don't pay for pandas/yfinance/jinja2.
 
 logger = get_logger(__name__)
 
+# Bounds concurrent per-ticker SEC work; together with the shared session's
+# connection limit this keeps a batch inside SEC's fair-access limits.
+MAX_CONCURRENT_TICKERS = 5
+
+async def analyze_ticker(retriever, generator, ticker, args, sem):
+    from data_extractor import DataExtractor
+    from data_validator import DataValidator
+    from ratio_calculator import RatioCalculator
+    from analysis import FinancialAnalyzer
+
+    # Full per-ticker pipeline, safe to run many at once under the semaphore
+    async with sem:
+        # 1. Retrieve raw data (SEC and yfinance fetches overlap)
+        cik, company_name = await retriever.get_cik_and_name(ticker)
+        filings, market_data = await asyncio.gather(
+            retriever.get_financial_filings(cik),
+            retriever.get_market_data(ticker),
+        )
+
+    # 2. Extract and structure data
+    extractor = DataExtractor()
+    fin_data = await extractor.extract_all_statements(filings, years=args.historical_years)
+
+    # 3. Validate and score data
+    validator = DataValidator()
+    fin_data_validated = validator.validate_data(fin_data, market_data)
+
+    # 4. Calculate ratios
+    ratio_calc = RatioCalculator()
+    ratios = ratio_calc.calculate_all_ratios(fin_data_validated, market_data)
+
+    # 5. Analyze (trends, benchmarks, peers)
+    analyzer = FinancialAnalyzer()
+    analysis = analyzer.analyze(
+        ratios,
+        fin_data_validated,
+        market_data,
+        company_name,
+        industry_benchmark=args.industry_benchmark,
+        peer_analysis=args.peer_analysis,
+    )
+
+    # 6. Generate report
+    return generator.generate(
+        ticker=ticker,
+        company_name=company_name,
+        report_data=analysis,
+        output_format=args.format,
+    )
+
 async def main():
     parser = argparse.ArgumentParser(description="Financial Analysis System")
-    parser.add_argument("ticker", help="Stock ticker symbol (e.g., AAPL)")
+    parser.add_argument("ticker", nargs="+", help="Stock ticker symbol(s) (e.g., AAPL MSFT)")
     parser.add_argument("--format", choices=["pdf", "html", "json", "both"], default="both", help="Output format")
     parser.add_argument("--industry-benchmark", action="store_true", help="Include industry benchmark comparison")
     parser.add_argument("--peer-analysis", action="store_true", help="Include peer analysis")
@@ -25,53 +72,31 @@ async def main():
 
     setup_logging(level="DEBUG" if args.verbose else "INFO")
 
-    try:
-        logger.info(f"Starting analysis for {args.ticker}")
-
-        # 1. Retrieve raw data
-        retriever = DataRetriever()
-        cik, company_name = await retriever.get_cik_and_name(args.ticker)
-        filings = await retriever.get_financial_filings(cik)
-        market_data = await retriever.get_market_data(args.ticker)
-
-        # 2. Extract and structure data
-        extractor = DataExtractor()
-        fin_data = await extractor.extract_all_statements(filings, years=args.historical_years)
-
-        # 3. Validate and score data
-        validator = DataValidator()
-        fin_data_validated = validator.validate_data(fin_data, market_data)
-
-        # 4. Calculate ratios
-        ratio_calc = RatioCalculator()
-        ratios = ratio_calc.calculate_all_ratios(fin_data_validated, market_data)
-
-        # 5. Analyze (trends, benchmarks, peers)
-        analyzer = FinancialAnalyzer()
-        analysis = analyzer.analyze(
-            ratios,
-            fin_data_validated,
-            market_data,
-            company_name,
-            industry_benchmark=args.industry_benchmark,
-            peer_analysis=args.peer_analysis,
-        )
+    logger.info("Starting analysis for %s", ", ".join(args.ticker))
 
-        # 6. Generate report
-        generator = ReportGenerator()
-        output_files = generator.generate(
-            ticker=args.ticker,
-            company_name=company_name,
-            report_data=analysis,
-            output_format=args.format,
-        )
+    from data_retriever import DataRetriever
+    from report_generator import ReportGenerator
 
-        logger.info("Analysis complete! Output files:")
-        for k, v in output_files.items():
-            print(f"{k}: {v}")
+    # One shared HTTP session and one report generator serve the whole batch;
+    # tickers run concurrently and one failure doesn't sink the others.
+    generator = ReportGenerator()
+    sem = asyncio.Semaphore(MAX_CONCURRENT_TICKERS)
+    async with DataRetriever() as retriever:
+        results = await asyncio.gather(
+            *(analyze_ticker(retriever, generator, t, args, sem) for t in args.ticker),
+            return_exceptions=True,
+        )
 
-    except Exception as e:
-        logger.error(f"Fatal error: {e}")
+    failed = False
+    for ticker, result in zip(args.ticker, results):
+        if isinstance(result, BaseException):
+            logger.error("Analysis failed for %s: %s", ticker, result)
+            failed = True
+        else:
+            logger.info("Analysis complete for %s! Output files:", ticker)
+            for k, v in result.items():
+                print(f"{k}: {v}")
+    if failed:
         sys.exit(1)
 
 if __name__ == "__main__":
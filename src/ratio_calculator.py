@@ -1,33 +1,44 @@
 # File: src/ratio_calculator.py
+import numpy as np
+from data_extractor import pivot_metrics
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Fixed column order for the fused ratio kernel; metrics missing from a
+# filing become NaN columns so the arithmetic stays branch-free.
+_METRICS = ("CurrentAssets", "CurrentLiabilities", "NetIncome", "Revenue",
+            "TotalLiabilities", "StockholdersEquity")
+_CA, _CL, _NI, _REV, _TL, _SE = range(len(_METRICS))
+
+# (ratio name, numerator column, denominator column)
+_RATIOS = (
+    ("Current Ratio", _CA, _CL),
+    ("Net Profit Margin", _NI, _REV),
+    ("Debt-to-Equity", _TL, _SE),
+)
+# ... additional ratios ...
+_NUM_IDX = np.array([n for _, n, _ in _RATIOS])
+_DEN_IDX = np.array([d for _, _, d in _RATIOS])
+
 class RatioCalculator:
     def calculate_all_ratios(self, fin_data, market_data):
-        # Compute ratios from standardized dataframes in fin_data dict
+        # Compute every ratio for every year in one fused NumPy pass.
+        # Missing data never raises here: absent metrics reindex to NaN
+        # columns and zero denominators are masked, so no try/except is
+        # needed to keep a partial filing from sinking the whole dict.
         ratios = {}
-        try:
-            # Example: Current Ratio
-            if "CurrentAssets" in fin_data and "CurrentLiabilities" in fin_data:
-                ca = fin_data["CurrentAssets"].iloc[0]["value"]
-                cl = fin_data["CurrentLiabilities"].iloc[0]["value"]
-                ratios["Current Ratio"] = ca / cl if cl else None
-
-            # Example: Net Profit Margin
-            if "NetIncome" in fin_data and "Revenue" in fin_data:
-                ni = fin_data["NetIncome"].iloc[0]["value"]
-                rev = fin_data["Revenue"].iloc[0]["value"]
-                ratios["Net Profit Margin"] = ni / rev if rev else None
-
-            # Example: Debt-to-Equity
-            if "TotalLiabilities" in fin_data and "StockholdersEquity" in fin_data:
-                debt = fin_data["TotalLiabilities"].iloc[0]["value"]
-                eq = fin_data["StockholdersEquity"].iloc[0]["value"]
-                ratios["Debt-to-Equity"] = debt / eq if eq else None
-
-            # ... additional ratios ...
-            logger.info("Ratios calculated successfully")
-        except Exception as e:
-            logger.warning(f"Error calculating ratios: {e}")
+        piv = pivot_metrics(fin_data)
+        if piv.empty:
+            logger.warning("No financial data available for ratio calculation")
+            return ratios
+        present = set(piv.columns)
+        arr = piv.reindex(columns=_METRICS).to_numpy(dtype=np.float64)
+        den = arr[:, _DEN_IDX]
+        matrix = arr[:, _NUM_IDX] / np.where(den == 0, np.nan, den)
+        latest = matrix[-1]  # pivot_metrics sorts by fiscal_year
+        for (name, num_col, den_col), value in zip(_RATIOS, latest):
+            if _METRICS[num_col] in present and _METRICS[den_col] in present:
+                ratios[name] = None if np.isnan(value) else float(value)
+        logger.info("Ratios calculated successfully")
         return ratios
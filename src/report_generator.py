@@ -1,7 +1,6 @@
 # File: src/report_generator.py
-import json
+import orjson
 from pathlib import Path
-from jinja2 import Environment, FileSystemLoader
 from datetime import datetime
 from utils.logger import get_logger
 
@@ -9,29 +8,49 @@ logger = get_logger(__name__)
 
 class ReportGenerator:
     def __init__(self):
+        # Deferred so CLI startup (argparse, --help) doesn't pay for jinja2
+        from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache
+
         self.template_dir = Path(__file__).parent.parent / "templates"
-        self.env = Environment(loader=FileSystemLoader(self.template_dir))
+        # Compiled templates persist across runs via the bytecode cache, and
+        # auto_reload=False skips the per-render mtime stat on the source.
+        Path(".jinja_cache").mkdir(exist_ok=True)
+        self.env = Environment(
+            loader=FileSystemLoader(self.template_dir),
+            bytecode_cache=FileSystemBytecodeCache(".jinja_cache"),
+            auto_reload=False,
+        )
+        self._html_template = self.env.get_template("report_template.html")
+        self._output_dir = Path("reports")
+        self._output_dir.mkdir(exist_ok=True)
 
     def generate(self, ticker, company_name, report_data, output_format="both"):
-        output_dir = Path("reports")
-        output_dir.mkdir(exist_ok=True)
+        # One timestamp per report so the json/html pair shares a name stem
+        ts = datetime.now().strftime("%Y%m%d_%H%M%S")
         files = {}
 
         # Save JSON
         if output_format in ("json", "both"):
-            json_file = output_dir / f"{ticker}_{datetime.now():%Y%m%d_%H%M%S}_report.json"
-            with open(json_file, "w") as f:
-                json.dump(report_data, f, indent=2, default=str)
+            json_file = self._output_dir / f"{ticker}_{ts}_report.json"
+            with open(json_file, "wb") as f:
+                # orjson serializes datetimes and numpy scalars natively, so
+                # the default=str fallback only fires for exotic types
+                f.write(orjson.dumps(
+                    report_data,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC,
+                    default=str,
+                ))
             files["json"] = str(json_file)
 
         # Render HTML
         if output_format in ("html", "both"):
-            template = self.env.get_template("report_template.html")
-            html_file = output_dir / f"{ticker}_{datetime.now():%Y%m%d_%H%M%S}_report.html"
+            html_file = self._output_dir / f"{ticker}_{ts}_report.html"
             # Pass 'now' to the template context as a datetime object, and flatten report_data for template context
             context = {**report_data, "company_name": company_name, "now": datetime.now()}
             with open(html_file, "w", encoding="utf-8") as f:
-                f.write(template.render(**context))
+                # stream() writes chunks as they render instead of building
+                # the whole report string in memory first
+                self._html_template.stream(**context).dump(f)
             files["html"] = str(html_file)
 
         logger.info(f"Report generated for {ticker}: {files}")